@@ -6,8 +6,20 @@ from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.styles import BabelFish
+from lxml import etree
+from collections import namedtuple
 import os
+import re
+import queue
+import shutil
+import threading
+import zipfile
+import functools
+import itertools
 from datetime import datetime
+from pathlib import Path
 import pythoncom
 
 # Attempt to import Windows-specific libraries for TOC updates
@@ -17,10 +29,108 @@ try:
 except ImportError:
     IS_WINDOWS = False
 
+# A TOC field is an instrText whose instruction starts with "TOC"; matched on the raw part bytes
+_TOC_FIELD_RE = re.compile(rb'<w:instrText\b[^>]*>\s*TOC\b')
+
+# Pre-qualified tag/attribute names, resolved once at import instead of per call
+_QN_DRAWING = qn('w:drawing')
+_QN_DRAWING_DESCENDANT = './/' + _QN_DRAWING
+_QN_FLDCHAR_TYPE = qn('w:fldCharType')
+_QN_XML_SPACE = qn('xml:space')
+_QN_BODY = qn('w:body')
+_QN_P = qn('w:p')
+_QN_TBL = qn('w:tbl')
+_QN_R = qn('w:r')
+_QN_T = qn('w:t')
+_QN_HYPERLINK = qn('w:hyperlink')
+_QN_PPR = qn('w:pPr')
+_QN_PSTYLE = qn('w:pStyle')
+_QN_JC = qn('w:jc')
+_QN_SPACING = qn('w:spacing')
+_QN_RPR = qn('w:rPr')
+_QN_RFONTS = qn('w:rFonts')
+_QN_SZ = qn('w:sz')
+_QN_STYLE = qn('w:style')
+_QN_NAME = qn('w:name')
+_QN_VAL = qn('w:val')
+_QN_ASCII = qn('w:ascii')
+_QN_TYPE = qn('w:type')
+_QN_DEFAULT = qn('w:default')
+_QN_STYLE_ID = qn('w:styleId')
+_QN_BEFORE = qn('w:before')
+_QN_AFTER = qn('w:after')
+_QN_LINE = qn('w:line')
+_QN_LINE_RULE = qn('w:lineRule')
+
+# Core properties that must all equal the file's base name
+_PROP_NAMES = ('title', 'subject', 'keywords', 'category', 'comments')
+
+_CORE_PROP_TAGS = {
+    'title': '{http://purl.org/dc/elements/1.1/}title',
+    'subject': '{http://purl.org/dc/elements/1.1/}subject',
+    'keywords': '{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}keywords',
+    'category': '{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}category',
+    'comments': '{http://purl.org/dc/elements/1.1/}description',
+}
+
+# Raw w:jc values for the alignments the checks care about
+_JC_LEFT, _JC_CENTER, _JC_JUSTIFY = 'left', 'center', 'both'
+
+# What the check pass needs to know about one body paragraph, read straight from the XML.
+# runs holds (ascii font, size in half-points); spacing holds raw (before, after, line, lineRule).
+_ParagraphFacts = namedtuple('_ParagraphFacts', 'index style align text has_drawing runs spacing')
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
 # =====================================================================
 #  ENHANCED DOCX PROCESSING AND TABLE DETECTION LOGIC
 # =====================================================================
 
+class WordSession:
+    """
+    Context manager handing out one hidden Word instance that stays alive across TOC updates,
+    so repeated updates skip Word's start-up and shutdown. COM is initialised once, on the
+    thread that first opens the session; call WordSession.close() when the app exits.
+    """
+    _app = None
+
+    def __enter__(self):
+        if WordSession._app is None:
+            pythoncom.CoInitialize()
+            word_app = win32com.client.DispatchEx("Word.Application")
+            word_app.Visible = False
+            word_app.DisplayAlerts = 0  # wdAlertsNone
+            word_app.ScreenUpdating = False
+            WordSession._app = word_app
+        return WordSession._app
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # A failed call can leave Word in an unknown state; start fresh next time
+        if exc_type is not None:
+            WordSession.close()
+        return False
+
+    @classmethod
+    def close(cls):
+        if cls._app is None:
+            return
+        try:
+            cls._app.Quit()
+        except Exception as e:
+            print(f"Error closing Word: {e}")
+        finally:
+            cls._app = None
+            try:
+                pythoncom.CoUninitialize()
+            except pythoncom.error:
+                pass
+
+
 class EnhancedDocxProcessor:
     """Handles advanced DOCX operations like TOC updates."""
 
@@ -34,20 +144,13 @@ class EnhancedDocxProcessor:
             messagebox.showwarning("Unsupported OS", "TOC update feature is only available on Windows with MS Word installed.")
             return False
         try:
-            pythoncom.CoInitialize()
-            word_app = win32com.client.Dispatch("Word.Application")
-            doc = word_app.Documents.Open(os.path.abspath(filepath))
-            doc.TablesOfContents(1).Update()
-            doc.Close(SaveChanges=True)
-            word_app.Quit()
-            pythoncom.CoUninitialize()
+            with WordSession() as word_app:
+                doc = word_app.Documents.Open(os.path.abspath(filepath))
+                doc.TablesOfContents(1).Update()
+                doc.Close(SaveChanges=True)
             return True
         except Exception as e:
             print(f"Error updating TOC with COM: {e}")
-            try:
-                pythoncom.CoUninitialize()
-            except pythoncom.error:
-                pass
             return False
 
     @staticmethod
@@ -58,17 +161,49 @@ class EnhancedDocxProcessor:
         doc.paragraphs[0].insert_paragraph_before("Table of Contents")
         run = doc.paragraphs[0].insert_paragraph_before().add_run()
         fldChar_begin = OxmlElement('w:fldChar')
-        fldChar_begin.set(qn('w:fldCharType'), 'begin')
+        fldChar_begin.set(_QN_FLDCHAR_TYPE, 'begin')
         instrText = OxmlElement('w:instrText')
-        instrText.set(qn('xml:space'), 'preserve')
+        instrText.set(_QN_XML_SPACE, 'preserve')
         instrText.text = 'TOC \\o "1-3" \\h \\z \\u'
         fldChar_end = OxmlElement('w:fldChar')
-        fldChar_end.set(qn('w:fldCharType'), 'end')
+        fldChar_end.set(_QN_FLDCHAR_TYPE, 'end')
         run._r.append(fldChar_begin)
         run._r.append(instrText)
         run._r.append(fldChar_end)
 
 
+_REF_HEADERS = frozenset({'publication number', 'priority date', 'filing date', 'inventor(s)', 'assignee(s)'})
+_LEGEND_KEYWORDS = ('supported:', 'inferentially supported:', 'partially supported:', 'not supported:')
+
+# All table-rule keywords in one alternation, tagged by rule, so a header row is scanned once
+# regardless of how many keywords there are. Rules are listed (and resolved) in priority order.
+_TABLE_RULE_KEYWORDS = (
+    ('reference', _REF_HEADERS),
+    ('legend', _LEGEND_KEYWORDS),
+    ('claim', ('claim element',)),
+)
+# Fonts left alone by the body text check and by the font fixes (symbol fonts carry glyphs, not text)
+_BODY_FONT_EXCEPTIONS = frozenset({'Segoe UI', 'Wingdings', 'Wingdings 2'})
+_FIX_FONT_EXCEPTIONS = frozenset({'Wingdings', 'Wingdings 2'})
+
+# Shared lengths for the fixes, built once instead of per run/paragraph
+_PT6 = Pt(6)
+_PT10 = Pt(10)
+_PT11 = Pt(11)
+
+# Required heading sizes; the check pass compares raw w:sz values, which are in half-points
+_HEADING_SPECS = {'Heading 1': Pt(28), 'Heading 2': Pt(20), 'Heading 3': Pt(14)}
+_HEADING_HALF_POINTS = {name: round(size.pt * 2) for name, size in _HEADING_SPECS.items()}
+
+# Symbol-only claim chart cells (checkmarks, crosses, "P"artial, "-") are centered
+_CLAIM_SYMBOL_ALIGN = dict.fromkeys(('✓', '☒', 'P', '-'), WD_ALIGN_PARAGRAPH.CENTER)
+
+_TABLE_RULE_PATTERN = re.compile('|'.join(
+    f"(?P<{tag}>{'|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))})"
+    for tag, keywords in _TABLE_RULE_KEYWORDS
+))
+
+
 class TableRuleEngine:
     """
     Detects table types and provides specific formatting rules based on new visual evidence.
@@ -76,14 +211,19 @@ class TableRuleEngine:
     @staticmethod
     def get_table_config(table, preceding_paragraph_text=""):
         """Analyzes a table and its context, returning a dictionary of formatting rules."""
-        headers = [cell.text.lower().strip() for cell in table.rows[0].cells] if table.rows else []
+        first_row_cells = table.rows[0].cells if table.rows else []
+        headers = tuple(cell.text.lower().strip() for cell in first_row_cells)
+        return TableRuleEngine._config_for(headers)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _config_for(headers):
+        """Pure rule lookup on the (hashable) header row; the returned dict is shared and must not be mutated."""
         header_text = " ".join(headers)
-        
-        first_row_content = [cell.text.lower().strip() for cell in table.rows[0].cells] if table.rows else []
+        hits = {m.lastgroup for m in _TABLE_RULE_PATTERN.finditer(header_text)}
 
         # Rule for Reference List Table (Image 2) - Left Aligned
-        reference_list_headers = ['publication number', 'priority date', 'filing date', 'inventor(s)', 'assignee(s)']
-        if any(h in header_text for h in reference_list_headers):
+        if 'reference' in hits:
             return {
                 'type': 'Reference List',
                 'header_align': WD_ALIGN_PARAGRAPH.CENTER,
@@ -91,8 +231,7 @@ class TableRuleEngine:
             }
 
         # Rule for Legend/Definition Table (Image 3) - Mixed Alignment
-        legend_keywords = ['supported:', 'inferentially supported:', 'partially supported:', 'not supported:']
-        if any(keyword in content for content in first_row_content for keyword in legend_keywords):
+        if 'legend' in hits:
             return {
                 'type': 'Legend Table',
                 'header_align': WD_ALIGN_PARAGRAPH.CENTER,
@@ -101,7 +240,7 @@ class TableRuleEngine:
             }
 
         # Rule for Claim Chart / Claim Matrix (Image 4) - Justified with centered symbols
-        if 'claim element' in header_text:
+        if 'claim' in hits:
             return {
                 'type': 'Claim Chart',
                 'header_align': WD_ALIGN_PARAGRAPH.CENTER,
@@ -130,8 +269,23 @@ class DocxFormatChecker:
         self.style.theme_use('clam')
         
         self.current_file = None
+        self._base_name = None
+        self._fixed_file = None
         self.doc = None
-        self.issues = []
+        self._para_meta = None  # (Document, [(Paragraph, style name)])
+        self._body_children = []
+        self._body_index = {}
+        self.issues = {}
+        self._para_facts = []
+        self._run_facts = None
+        self._h1_spans = []
+        self._table_count = 0
+        self._has_toc = False
+        self._toc_cache = None  # (path, mtime, has_toc)
+        self._core_props = {}
+        self._results = queue.Queue()
+        self._pending = []
+        self._checking = False
         
         self.setup_ui()
         
@@ -182,23 +336,41 @@ class DocxFormatChecker:
     def browse_file(self):
         filename = filedialog.askopenfilename(title="Select DOCX file", filetypes=[("Word Documents", "*.docx")])
         if filename:
-            self.current_file = filename
+            self._set_file(filename)
             self.file_label.config(text=os.path.basename(filename))
             self.status_label.config(text=f"Loaded: {os.path.basename(filename)}")
             self.results_text.delete(1.0, tk.END)
 
+    def _set_file(self, filename):
+        """Selects filename and derives the names used later (base name, _fixed sibling) once."""
+        path = Path(filename)
+        self.current_file = filename
+        self._base_name = path.stem
+        self._fixed_file = str(path.with_name(f"{path.stem}_fixed{path.suffix}"))
+
     def check_format(self):
         if not self.current_file:
             messagebox.showwarning("No File", "Please select a DOCX file first.")
             return
+        if self._checking:
+            return
         
-        self.issues = []
+        self.issues = {}
         self.results_text.delete(1.0, tk.END)
         self.status_label.config(text="Checking document...")
-        self.root.update_idletasks()
+        self._checking = True
+
+        # The scan runs off the Tk thread; its output is buffered and handed back to the Tk thread to insert
+        threading.Thread(target=self._do_checks, daemon=True).start()
+        self.root.after(30, self._drain_queue)
 
+    def _do_checks(self):
+        """Runs every check in the background thread. UI updates go through the results queue."""
         try:
-            self.doc = Document(self.current_file)
+            # The check pass is read-only, so stream document.xml instead of building a Document;
+            # apply_fixes loads the full Document when it actually needs to mutate it.
+            self.doc = None
+            self._stream_check()
             self.check_body_text()
             self.check_headings()
             self.check_tables()
@@ -209,203 +381,414 @@ class DocxFormatChecker:
             self.check_toc_font()
             self.display_summary()
         except Exception as e:
-            messagebox.showerror("Error", f"An error occurred while checking the document:\n{str(e)}")
-            self.status_label.config(text="Error occurred.")
+            self._flush_pending()
+            error = str(e)
+            self._post_ui(lambda: messagebox.showerror("Error", f"An error occurred while checking the document:\n{error}"))
+            self._post_ui(lambda: self.status_label.config(text="Error occurred."))
+        finally:
+            self._flush_pending()
+            self._post_ui(self._finish_check)
+
+    def _emit(self, text, tag=None):
+        """Buffers a line of check output; nothing reaches the widget until _flush_pending."""
+        self._pending.append((text, tag))
+
+    def _flush_pending(self):
+        """Hands the buffered output to the Tk thread as a single batch."""
+        batch, self._pending = self._pending, []
+        if batch:
+            self._post_ui(lambda: self._insert_batch(batch))
+
+    def _insert_batch(self, batch):
+        """Inserts buffered output with one widget call per run of same-tag text."""
+        self.results_text.configure(autoseparators=False)
+        for tag, group in itertools.groupby(batch, key=lambda item: item[1]):
+            self.results_text.insert(tk.END, ''.join(text for text, _ in group), tag)
+        self.results_text.configure(autoseparators=True)
+
+    def _post_ui(self, callback):
+        """Queues a callable to run on the Tk thread; safe to call from the worker thread."""
+        self._results.put(callback)
+
+    def _finish_check(self):
+        self._checking = False
+
+    def _drain_queue(self, batch_size=200):
+        """Runs up to batch_size queued UI callbacks, then reschedules itself while the check is running."""
+        for _ in range(batch_size):
+            try:
+                callback = self._results.get_nowait()
+            except queue.Empty:
+                break
+            callback()
+        if self._checking or not self._results.empty():
+            self.root.after(30, self._drain_queue)
 
     def display_summary(self):
-        self.results_text.insert(tk.END, "\n" + "="*80 + "\n", "header")
-        self.results_text.insert(tk.END, "CHECK SUMMARY\n", "header")
+        self._emit("\n" + "="*80 + "\n", "header")
+        self._emit("CHECK SUMMARY\n", "header")
         if not self.issues:
-            self.results_text.insert(tk.END, "✓ Congratulations! All quality checks passed.\n", "success")
+            self._emit("✓ Congratulations! All quality checks passed.\n", "success")
         else:
-            self.results_text.insert(tk.END, f"Found {len(self.issues)} issues to address.\n", "error")
-            self.results_text.insert(tk.END, "Click 'Apply All Fixes' to correct them automatically.\n", "info")
-        self.status_label.config(text="Check complete.")
+            self._emit(f"Found {len(self.issues)} issues to address.\n", "error")
+            self._emit("Click 'Apply All Fixes' to correct them automatically.\n", "info")
+        self._post_ui(lambda: self.status_label.config(text="Check complete."))
         
+    def _stream_check(self):
+        """
+        Collects paragraph facts, Heading 1 section spans, table count, TOC presence and core properties in a single
+        iterparse pass over the package, clearing each element once it has been read.
+        """
+        self._para_facts = []
+        self._run_facts = None
+        self._h1_spans = []
+        self._table_count = 0
+        h1_start = None
+
+        with zipfile.ZipFile(self.current_file) as zf:
+            self._has_toc = self._scan_toc(zf)
+            style_names, default_style = self._read_paragraph_styles(zf)
+            self._core_props = self._read_core_properties(zf)
+
+            with zf.open('word/document.xml') as fh:
+                for _, elem in etree.iterparse(fh, events=('end',), tag=(_QN_P, _QN_TBL)):
+                    parent = elem.getparent()
+                    at_body = parent is not None and parent.tag == _QN_BODY
+
+                    if elem.tag == _QN_P:
+                        if at_body:
+                            facts = self._paragraph_facts(elem, len(self._para_facts), style_names, default_style)
+                            self._para_facts.append(facts)
+                            # Track the [start, end) paragraph ranges under a Heading 1, up to the next H1/H2/H3
+                            if facts.style in ('Heading 1', 'Heading 2', 'Heading 3'):
+                                if h1_start is not None:
+                                    self._h1_spans.append((h1_start, facts.index))
+                                h1_start = facts.index + 1 if facts.style == 'Heading 1' else None
+                    elif at_body:
+                        self._table_count += 1
+
+                    elem.clear(keep_tail=True)
+                    if at_body:
+                        while elem.getprevious() is not None:
+                            del parent[0]
+
+        if h1_start is not None:
+            self._h1_spans.append((h1_start, len(self._para_facts)))
+
+    def _scan_toc(self, zf):
+        """
+        Answers "is there a TOC field?" with a byte scan of document.xml rather than an XML walk.
+        The answer is cached per file version (path and mtime), so a re-check of an unchanged file skips the read.
+        """
+        mtime = os.path.getmtime(self.current_file)
+        if self._toc_cache and self._toc_cache[:2] == (self.current_file, mtime):
+            return self._toc_cache[2]
+        data = zf.read('word/document.xml')
+        has_toc = b'instrText' in data and _TOC_FIELD_RE.search(data) is not None
+        self._toc_cache = (self.current_file, mtime, has_toc)
+        return has_toc
+
+    def _collect_run_facts(self):
+        """
+        Flattens the streamed run data into parallel lists (paragraph index, style, font,
+        size in half-points) so the font checks scan one flat table instead of nested runs.
+        Built once per check and reused by every check that inspects runs.
+        """
+        if self._run_facts is None:
+            para_idx, styles, fonts, sizes = [], [], [], []
+            for p in self._para_facts:
+                for font_name, size in p.runs:
+                    para_idx.append(p.index)
+                    styles.append(p.style)
+                    fonts.append(font_name)
+                    sizes.append(size)
+            self._run_facts = (para_idx, styles, fonts, sizes)
+        return self._run_facts
+
+    def _first_bad_runs(self, is_bad):
+        """Maps paragraph index -> (font, size) of its first run for which is_bad(style, font, size) holds."""
+        bad = {}
+        for i, style_name, font_name, size in zip(*self._collect_run_facts()):
+            if i not in bad and is_bad(style_name, font_name, size):
+                bad[i] = (font_name, size)
+        return bad
+
+    @staticmethod
+    def _paragraph_facts(p, index, style_names, default_style):
+        """Reads the style, alignment, text, runs and spacing of one w:p element."""
+        style, align, spacing = default_style, None, (None, None, None, None)
+        ppr = p.find(_QN_PPR)
+        if ppr is not None:
+            pstyle = ppr.find(_QN_PSTYLE)
+            if pstyle is not None:
+                style = style_names.get(pstyle.get(_QN_VAL), default_style)
+            jc = ppr.find(_QN_JC)
+            if jc is not None:
+                align = jc.get(_QN_VAL)
+            sp = ppr.find(_QN_SPACING)
+            if sp is not None:
+                spacing = (sp.get(_QN_BEFORE), sp.get(_QN_AFTER), sp.get(_QN_LINE), sp.get(_QN_LINE_RULE))
+
+        runs = []
+        for r in p.iterchildren(_QN_R):
+            font = size = None
+            rpr = r.find(_QN_RPR)
+            if rpr is not None:
+                rfonts = rpr.find(_QN_RFONTS)
+                if rfonts is not None:
+                    font = rfonts.get(_QN_ASCII)
+                sz = rpr.find(_QN_SZ)
+                if sz is not None:
+                    size = _to_int(sz.get(_QN_VAL))
+            runs.append((font, size))
+
+        text = ''.join(t.text or '' for child in p.iterchildren(_QN_R, _QN_HYPERLINK) for t in child.iter(_QN_T))
+        return _ParagraphFacts(index, style, align, text, p.find(_QN_DRAWING_DESCENDANT) is not None, runs, spacing)
+
+    @staticmethod
+    def _read_paragraph_styles(zf):
+        """Maps paragraph styleIds to their UI names and returns the default paragraph style name."""
+        names, default = {}, ''
+        try:
+            root = etree.fromstring(zf.read('word/styles.xml'))
+        except KeyError:
+            return names, default
+        for style in root.iterchildren(_QN_STYLE):
+            if style.get(_QN_TYPE) != 'paragraph':
+                continue
+            name_el = style.find(_QN_NAME)
+            name = BabelFish.internal2ui(name_el.get(_QN_VAL)) if name_el is not None else ''
+            names[style.get(_QN_STYLE_ID)] = name
+            if style.get(_QN_DEFAULT) in ('1', 'true', 'on'):
+                default = name
+        return names, default
+
+    @staticmethod
+    def _read_core_properties(zf):
+        """Reads the checked core properties from docProps/core.xml ('' when absent)."""
+        try:
+            root = etree.fromstring(zf.read('docProps/core.xml'))
+        except KeyError:
+            return {name: '' for name in _PROP_NAMES}
+        props = {}
+        for name in _PROP_NAMES:
+            el = root.find(_CORE_PROP_TAGS[name])
+            props[name] = (el.text or '') if el is not None else ''
+        return props
+
+    def _add_issue(self, fix_type, paragraph=None):
+        """Records an issue once per (type, paragraph); repeat reports for the same target collapse."""
+        issue = {'type': fix_type} if paragraph is None else {'type': fix_type, 'paragraph': paragraph}
+        self.issues.setdefault((fix_type, paragraph), issue)
+
+    def _emit_result(self, errors):
+        """Emits a check's error lines as one block, or its pass line when there were none."""
+        if errors:
+            self._emit(''.join(errors), "error")
+        else:
+            self._emit("  ✓ Correct\n", "success")
+
     # --- Individual Check Methods ---
 
     def check_body_text(self):
-        self.results_text.insert(tk.END, "1. Body Text\n", "header")
-        font_exceptions = ['Segoe UI', 'Wingdings', 'Wingdings 2']
-        found = False
-        for i, para in enumerate(self.doc.paragraphs):
-            is_image_para = bool(para._element.xpath('.//w:drawing'))
-            
-            if para.style.name == 'Normal' and para.text.strip():
-                if not is_image_para and para.alignment != WD_ALIGN_PARAGRAPH.JUSTIFY:
-                    self.issues.append({'type': 'body_alignment', 'paragraph': i})
-                    self.results_text.insert(tk.END, f"  ✗ Body text (Para {i+1}): Not justified.\n", "error")
-                    found = True
+        self._emit("1. Body Text\n", "header")
+        errors = []
+        bad_fonts = self._first_bad_runs(
+            lambda style_name, font_name, _: style_name == 'Normal' and font_name not in _BODY_FONT_EXCEPTIONS and font_name != 'Calibri')
+        for para in self._para_facts:
+            i = para.index
+            if para.style == 'Normal' and para.text.strip():
+                if not para.has_drawing and para.align != _JC_JUSTIFY:
+                    self._add_issue('body_alignment', i)
+                    errors.append(f"  ✗ Body text (Para {i+1}): Not justified.\n")
                     
-                for run in para.runs:
-                    if run.font.name not in font_exceptions and run.font.name != 'Calibri':
-                        self.issues.append({'type': 'body_font', 'paragraph': i})
-                        self.results_text.insert(tk.END, f"  ✗ Body text (Para {i+1}): Incorrect font '{run.font.name}'.\n", "error")
-                        found = True
-                        break
-        if not found: self.results_text.insert(tk.END, "  ✓ Correct\n", "success")
+                if i in bad_fonts:
+                    self._add_issue('body_font', i)
+                    errors.append(f"  ✗ Body text (Para {i+1}): Incorrect font '{bad_fonts[i][0]}'.\n")
+        self._emit_result(errors)
 
     def check_headings(self):
-        self.results_text.insert(tk.END, "2. Headings\n", "header")
-        specs = {'Heading 1': 28, 'Heading 2': 20, 'Heading 3': 14}
-        found = False
-        for i, p in enumerate(self.doc.paragraphs):
-            if p.style.name in specs:
-                if p.alignment != WD_ALIGN_PARAGRAPH.LEFT:
-                    self.issues.append({'type': 'heading_format', 'paragraph': i})
-                    self.results_text.insert(tk.END, f"  ✗ {p.style.name} (Para {i+1}): Not left-aligned.\n", "error")
-                    found = True
-                for run in p.runs:
-                    if run.font.name != 'Cambria' or run.font.size != Pt(specs[p.style.name]):
-                        self.issues.append({'type': 'heading_format', 'paragraph': i})
-                        self.results_text.insert(tk.END, f"  ✗ {p.style.name} (Para {i+1}): Incorrect font or size.\n", "error")
-                        found = True
-                        break
-        if not found: self.results_text.insert(tk.END, "  ✓ Correct\n", "success")
+        self._emit("2. Headings\n", "header")
+        specs = _HEADING_HALF_POINTS
+        errors = []
+        bad_runs = self._first_bad_runs(
+            lambda style_name, font_name, size: style_name in specs and (font_name != 'Cambria' or size != specs[style_name]))
+        for p in self._para_facts:
+            i, style_name = p.index, p.style
+            if style_name in specs:
+                if p.align != _JC_LEFT:
+                    self._add_issue('heading_format', i)
+                    errors.append(f"  ✗ {style_name} (Para {i+1}): Not left-aligned.\n")
+                if i in bad_runs:
+                    self._add_issue('heading_format', i)
+                    errors.append(f"  ✗ {style_name} (Para {i+1}): Incorrect font or size.\n")
+        self._emit_result(errors)
 
     def check_tables(self):
-        self.results_text.insert(tk.END, "3. Tables\n", "header")
-        if not self.doc.tables:
-            self.results_text.insert(tk.END, "  - No tables found.\n", "info")
+        self._emit("3. Tables\n", "header")
+        if not self._table_count:
+            self._emit("  - No tables found.\n", "info")
             return
         
-        self.issues.append({'type': 'fix_all_tables'})
-        self.results_text.insert(tk.END, "  - All tables scheduled for formatting review and fix.\n", "info")
+        self._add_issue('fix_all_tables')
+        self._emit("  - All tables scheduled for formatting review and fix.\n", "info")
         
     def check_images(self):
-        self.results_text.insert(tk.END, "4. Images\n", "header")
-        found = False
-        for i, p in enumerate(self.doc.paragraphs):
-            if p._element.xpath('.//w:drawing') and p.alignment != WD_ALIGN_PARAGRAPH.CENTER:
-                self.issues.append({'type': 'image_alignment', 'paragraph': i})
-                self.results_text.insert(tk.END, f"  ✗ Image near paragraph {i+1}: Not centered.\n", "error")
-                found = True
-        if not found: self.results_text.insert(tk.END, "  ✓ Correct\n", "success")
+        self._emit("4. Images\n", "header")
+        errors = []
+        for p in self._para_facts:
+            i = p.index
+            if p.has_drawing and p.align != _JC_CENTER:
+                self._add_issue('image_alignment', i)
+                errors.append(f"  ✗ Image near paragraph {i+1}: Not centered.\n")
+        self._emit_result(errors)
 
     def check_line_spacing(self):
-        self.results_text.insert(tk.END, "5. Spacing After Heading 1\n", "header")
-        found = False
-        in_h1_content = False
-        for i, p in enumerate(self.doc.paragraphs):
-            if p.style.name == 'Heading 1':
-                in_h1_content = True
-                continue
-            if p.style.name in ['Heading 2', 'Heading 3']:
-                in_h1_content = False
-            if in_h1_content and p.text.strip():
-                pf = p.paragraph_format
-                if pf.space_before != Pt(6) or pf.space_after != Pt(6) or (pf.line_spacing is not None and abs(pf.line_spacing - 1.33) > 0.01):
-                    self.issues.append({'type': 'line_spacing', 'paragraph': i})
-                    self.results_text.insert(tk.END, f"  ✗ Content at paragraph {i+1}: Incorrect line/paragraph spacing.\n", "error")
-                    found = True
-        if not found: self.results_text.insert(tk.END, "  ✓ Correct\n", "success")
+        self._emit("5. Spacing After Heading 1\n", "header")
+        errors = []
+        # Only the Heading 1 sections recorded by the stream pass need checking
+        for start, end in self._h1_spans:
+            for p in self._para_facts[start:end]:
+                if p.text.strip() and not self._spacing_ok(p.spacing):
+                    self._add_issue('line_spacing', p.index)
+                    errors.append(f"  ✗ Content at paragraph {p.index+1}: Incorrect line/paragraph spacing.\n")
+        self._emit_result(errors)
+
+    @staticmethod
+    def _spacing_ok(spacing):
+        """6pt before/after (120 twips) and, for auto line rules, 1.33 line spacing (in 240ths)."""
+        before, after, line, line_rule = spacing
+        if _to_int(before) != 120 or _to_int(after) != 120:
+            return False
+        if line is None:
+            return True
+        if line_rule not in (None, 'auto'):
+            return False
+        line = _to_int(line)
+        return line is not None and abs(line / 240.0 - 1.33) <= 0.01
 
     def check_document_properties(self):
-        self.results_text.insert(tk.END, "6. Document Properties\n", "header")
-        base_name = os.path.splitext(os.path.basename(self.current_file))[0]
-        props = self.doc.core_properties
-        if any(getattr(props, p) != base_name for p in ['title', 'subject', 'keywords', 'category', 'comments']):
-            self.issues.append({'type': 'doc_properties'})
-            self.results_text.insert(tk.END, "  ✗ Properties do not match filename.\n", "error")
+        self._emit("6. Document Properties\n", "header")
+        props = self._core_props
+        if any(props[p] != self._base_name for p in _PROP_NAMES):
+            self._add_issue('doc_properties')
+            self._emit("  ✗ Properties do not match filename.\n", "error")
         else:
-            self.results_text.insert(tk.END, "  ✓ Correct\n", "success")
+            self._emit("  ✓ Correct\n", "success")
 
     def check_toc(self):
-        self.results_text.insert(tk.END, "7. Table of Contents\n", "header")
-        if not any('TOC' in p._element.xml for p in self.doc.paragraphs):
-            self.issues.append({'type': 'toc_missing'})
-            self.results_text.insert(tk.END, "  ✗ TOC is missing from the document.\n", "error")
+        self._emit("7. Table of Contents\n", "header")
+        if not self._has_toc:
+            self._add_issue('toc_missing')
+            self._emit("  ✗ TOC is missing from the document.\n", "error")
         else:
-            self.results_text.insert(tk.END, "  ✓ TOC is present.\n", "success")
+            self._emit("  ✓ TOC is present.\n", "success")
 
     def check_toc_font(self):
-        self.results_text.insert(tk.END, "8. TOC Font\n", "header")
+        self._emit("8. TOC Font\n", "header")
         found_issue = False
-        is_present = any('TOC' in p._element.xml for p in self.doc.paragraphs)
-        if not is_present:
-            self.results_text.insert(tk.END, "  - TOC not present, skipping font check.\n", "info")
+        if not self._has_toc:
+            self._emit("  - TOC not present, skipping font check.\n", "info")
             return
 
-        for p in self.doc.paragraphs:
-            if p.style and p.style.name.startswith('TOC'):
-                for run in p.runs:
-                    if run.font.name != 'Calibri' or run.font.size != Pt(11):
-                        self.issues.append({'type': 'toc_font'})
-                        self.results_text.insert(tk.END, f"  ✗ TOC Style '{p.style.name}': Incorrect font ('{run.font.name}') or size.\n", "error")
-                        found_issue = True
-                        break 
-                if found_issue:
-                    break 
+        for _, style_name, font_name, size in zip(*self._collect_run_facts()):
+            if style_name.startswith('TOC') and (font_name != 'Calibri' or size != 22):
+                self._add_issue('toc_font')
+                self._emit(f"  ✗ TOC Style '{style_name}': Incorrect font ('{font_name}') or size.\n", "error")
+                found_issue = True
+                break
         if not found_issue:
-            self.results_text.insert(tk.END, "  ✓ Correct\n", "success")
+            self._emit("  ✓ Correct\n", "success")
             
     # --- Fixing Logic ---
 
     def apply_fixes(self):
+        if self._checking:
+            messagebox.showinfo("Busy", "The document check is still running.")
+            return
         if not self.issues:
             messagebox.showinfo("No Issues", "There are no issues to fix.")
             return
 
         try:
-            backup_file = self.current_file.replace('.docx', f'_backup_{datetime.now():%Y%m%d%H%M%S}.docx')
-            self.doc.save(backup_file)
+            if self.doc is None:
+                self.doc = Document(self.current_file)
+            path = Path(self.current_file)
+            backup_file = str(path.with_name(f"{path.stem}_backup_{datetime.now():%Y%m%d%H%M%S}{path.suffix}"))
+            shutil.copyfile(self.current_file, backup_file)
 
-            applied_fixes = set()
+            for issue in self.issues.values():
+                self.fix_issue(issue)
 
-            for issue in self.issues:
-                fix_type = issue['type']
-                if fix_type not in applied_fixes or 'paragraph' in issue:
-                    self.fix_issue(issue)
-                    if 'paragraph' not in issue:
-                        applied_fixes.add(fix_type)
-
-            fixed_file = self.current_file.replace('.docx', '_fixed.docx')
-            self.doc.save(fixed_file)
+            fixed_file = self._fixed_file
+            self._save_fixed(fixed_file)
             messagebox.showinfo("Success", f"Fixes applied successfully.\n\nA backup was saved as:\n{os.path.basename(backup_file)}\n\nThe corrected file is:\n{os.path.basename(fixed_file)}")
             self.status_label.config(text="Fixes applied.")
         except Exception as e:
             messagebox.showerror("Error Applying Fixes", f"An error occurred: {str(e)}")
+        finally:
+            self._para_meta = None
+
+    def _save_fixed(self, fixed_file):
+        """
+        Writes the fixed document by copying the source package and rewriting only the parts the
+        fixes can touch (document body and core properties), instead of re-serializing every part.
+        Falls back to a full save if a rewritten part is not already a member of the source package.
+        """
+        parts = (self.doc.part, self.doc.part.package.part_related_by(RT.CORE_PROPERTIES))
+        dirty = {part.partname.membername: part.blob for part in parts}
+
+        with zipfile.ZipFile(self.current_file) as src:
+            if not dirty.keys() <= set(src.namelist()):
+                self.doc.save(fixed_file)
+                return
+            with zipfile.ZipFile(fixed_file, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=6) as dst:
+                for info in src.infolist():
+                    if info.filename in dirty:
+                        dst.writestr(info.filename, dirty[info.filename])
+                    else:
+                        with src.open(info) as fin, dst.open(info, 'w') as fout:
+                            shutil.copyfileobj(fin, fout, 64 * 1024)
 
     def fix_issue(self, issue):
         fix_type = issue['type']
-        font_exceptions = ['Wingdings', 'Wingdings 2']
         
         if fix_type == 'body_alignment':
-            self.doc.paragraphs[issue['paragraph']].alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+            self._paragraph_meta(self.doc)[issue['paragraph']][0].alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
         elif fix_type == 'body_font':
-            p = self.doc.paragraphs[issue['paragraph']]
+            p = self._paragraph_meta(self.doc)[issue['paragraph']][0]
             for run in p.runs:
-                if run.font.name not in font_exceptions:
+                if run.font.name not in _FIX_FONT_EXCEPTIONS:
                     run.font.name = 'Segoe UI'
-                    run.font.size = Pt(10)
+                    run.font.size = _PT10
         
         elif fix_type == 'heading_format':
-            p = self.doc.paragraphs[issue['paragraph']]
-            specs = {'Heading 1': 28, 'Heading 2': 20, 'Heading 3': 14}
-            size = specs.get(p.style.name)
+            p, style_name = self._paragraph_meta(self.doc)[issue['paragraph']]
+            size = _HEADING_SPECS.get(style_name)
             p.alignment = WD_ALIGN_PARAGRAPH.LEFT
             for run in p.runs:
                 run.font.name = 'Cambria'
-                if size: run.font.size = Pt(size)
+                if size: run.font.size = size
         
         elif fix_type == 'image_alignment':
-            self.doc.paragraphs[issue['paragraph']].alignment = WD_ALIGN_PARAGRAPH.CENTER
+            self._paragraph_meta(self.doc)[issue['paragraph']][0].alignment = WD_ALIGN_PARAGRAPH.CENTER
         
         elif fix_type == 'line_spacing':
-            p = self.doc.paragraphs[issue['paragraph']]
+            p = self._paragraph_meta(self.doc)[issue['paragraph']][0]
             pf = p.paragraph_format
-            pf.space_before = Pt(6)
-            pf.space_after = Pt(6)
+            pf.space_before = _PT6
+            pf.space_after = _PT6
             pf.line_spacing = 1.33
         
         elif fix_type == 'doc_properties':
-            base_name = os.path.splitext(os.path.basename(self.current_file))[0]
             props = self.doc.core_properties
-            for p_name in ['title', 'subject', 'keywords', 'category', 'comments']:
-                setattr(props, p_name, base_name)
+            for p_name in _PROP_NAMES:
+                if self._core_props.get(p_name) != self._base_name:
+                    setattr(props, p_name, self._base_name)
         
         elif fix_type == 'toc_missing':
             EnhancedDocxProcessor.add_toc_to_document(self.doc)
+            self._para_meta = None  # paragraphs were inserted, indices have shifted
         
         elif fix_type == 'toc_font':
             self.format_toc_font(self.doc)
@@ -413,20 +796,28 @@ class DocxFormatChecker:
         elif fix_type == 'fix_all_tables':
             self.format_all_tables()
 
+    def _paragraph_meta(self, doc):
+        """
+        Returns (paragraph, style name) for every body paragraph of doc, built on first use.
+        Fixes index into it instead of rebuilding doc.paragraphs and re-resolving p.style per issue.
+        """
+        if self._para_meta is None or self._para_meta[0] is not doc:
+            self._para_meta = (doc, [(p, (p.style.name or '') if p.style else '') for p in doc.paragraphs])
+        return self._para_meta[1]
+
     def get_paragraph_before(self, element):
         """Finds the paragraph element immediately before the given element (e.g., a table)."""
-        try:
-            body_children = list(self.doc.element.body)
-            element_idx = body_children.index(element._element)
-            if element_idx > 0:
-                prev_elm = body_children[element_idx - 1]
-                if prev_elm.tag.endswith('p'):
-                    return docx.text.paragraph.Paragraph(prev_elm, self.doc)
-        except (ValueError, IndexError):
-            pass
+        element_idx = self._body_index.get(element._element)
+        if element_idx:
+            prev_elm = self._body_children[element_idx - 1]
+            if prev_elm.tag.endswith('p'):
+                return docx.text.paragraph.Paragraph(prev_elm, self.doc)
         return None
 
     def format_all_tables(self):
+        # Index the body once per pass; holding the children keeps their lxml proxies (and identities) alive
+        self._body_children = list(self.doc.element.body)
+        self._body_index = {el: i for i, el in enumerate(self._body_children)}
         for table in self.doc.tables:
             prev_para = self.get_paragraph_before(table)
             prev_para_text = prev_para.text if prev_para else ""
@@ -434,54 +825,54 @@ class DocxFormatChecker:
             
     def format_toc_font(self, doc):
         """Sets the font for paragraphs with TOC styles to Calibri 11pt."""
-        for p in doc.paragraphs:
-            if p.style and p.style.name.startswith('TOC'):
+        for p, style_name in self._paragraph_meta(doc):
+            if style_name.startswith('TOC'):
                 for run in p.runs:
                     run.font.name = 'Calibri'
-                    run.font.size = Pt(11)
+                    run.font.size = _PT11
 
     def format_table(self, table, preceding_text=""):
         config = TableRuleEngine.get_table_config(table, preceding_text)
-        font_exceptions = ['Wingdings', 'Wingdings 2']
-        symbols = ['✓', '☒', 'P', '-']
 
-        for r_idx, row in enumerate(table.rows):
-            for c_idx, cell in enumerate(row.cells):
-                is_header_row = (r_idx == 0)
+        # Snapshot the cell grid once; every row.cells access rebuilds it from XML
+        flat = table._cells
+        ncols = len(table.columns)
+        nrows = len(flat) // ncols if ncols else 0
 
+        # Resolve the alignment plan once per table: the header row, then one alignment per body column.
+        # Legend tables and claim charts center the first ('#') column and justify the rest.
+        is_claim_chart = config['type'] == 'Claim Chart'
+        if is_claim_chart or config.get('special_rules', {}).get('legend_formatting'):
+            body_aligns = [WD_ALIGN_PARAGRAPH.CENTER] + [WD_ALIGN_PARAGRAPH.JUSTIFY] * (ncols - 1)
+        else:
+            body_aligns = [config.get('body_align', WD_ALIGN_PARAGRAPH.JUSTIFY)] * ncols
+        row_aligns = [[config['header_align']] * ncols] + [body_aligns] * (nrows - 1)
+        # Claim charts also center paragraphs that hold just a symbol
+        symbol_aligns = _CLAIM_SYMBOL_ALIGN if is_claim_chart else None
+
+        for r_idx in range(nrows):
+            row_cells = flat[r_idx * ncols:(r_idx + 1) * ncols]
+            aligns = row_aligns[r_idx]
+            for c_idx, cell in enumerate(row_cells):
+                col_align = aligns[c_idx]
                 for p in cell.paragraphs:
-                    # Determine alignment based on new rules
-                    alignment = config.get('body_align', WD_ALIGN_PARAGRAPH.JUSTIFY)
-
-                    if is_header_row:
-                        alignment = config['header_align']
-                    
-                    # Rule for Legend Table (Image 3)
-                    elif config.get('special_rules', {}).get('legend_formatting'):
-                        alignment = WD_ALIGN_PARAGRAPH.CENTER if c_idx == 0 else WD_ALIGN_PARAGRAPH.JUSTIFY
-                    
-                    # Rule for Claim Charts (Image 4): Center symbols and # column
-                    elif config['type'] == 'Claim Chart':
-                        # Center align if it's the first column (e.g., '#') or if the cell text is just a symbol
-                        if c_idx == 0 or p.text.strip() in symbols:
-                            alignment = WD_ALIGN_PARAGRAPH.CENTER
-                        else:
-                            alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-                    
-                    p.alignment = alignment
+                    if symbol_aligns and r_idx:
+                        p.alignment = symbol_aligns.get(p.text.strip(), col_align)
+                    else:
+                        p.alignment = col_align
 
                     # Format fonts
                     for run in p.runs:
-                        if run.font.name not in font_exceptions:
+                        if run.font.name not in _FIX_FONT_EXCEPTIONS:
                             run.font.name = 'Segoe UI'
-                            run.font.size = Pt(10)
+                            run.font.size = _PT10
 
     def update_toc(self):
         if not self.current_file:
             messagebox.showwarning("No File", "Please load a file first.")
             return
 
-        fixed_file = self.current_file.replace('.docx', '_fixed.docx')
+        fixed_file = self._fixed_file
         target_file = fixed_file if os.path.exists(fixed_file) else self.current_file
 
         self.status_label.config(text="Updating TOC... This requires MS Word and may take a moment.")
@@ -498,6 +889,8 @@ def main():
     root = tk.Tk()
     app = DocxFormatChecker(root)
     root.mainloop()
+    if IS_WINDOWS:
+        WordSession.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,10 +1,17 @@
 import sys
 import os
+import io
 import asyncio
 import shutil
 import time
+import itertools
+import queue
+from copy import deepcopy
 from pathlib import Path
-from typing import List, Optional
+from threading import Thread
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from typing import AsyncIterator, List, Optional, Tuple
 from mimetypes import guess_type
 from urllib.request import urlopen
 from urllib.error import URLError
@@ -13,8 +20,8 @@ import img2pdf
 from PIL import Image
 import fitz  # PyMuPDF
 from docx import Document
-from docx.shared import Pt, Cm
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Pt, Cm, Twips
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.oxml.ns import qn
 from playwright.async_api import async_playwright, TimeoutError as PWTimeout
 
@@ -42,56 +49,135 @@ def new_run_dir() -> Path:
     from datetime import datetime
     stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
     d = app_base_dir() / f"run-{stamp}"
-    (d / "raw").mkdir(parents=True, exist_ok=True)
     (d / "translated").mkdir(parents=True, exist_ok=True)
     return d
 
 
-IMG_EXTS = {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tif", ".tiff"}
+IMG_EXTS = frozenset({".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tif", ".tiff"})
+JPEG_QUALITY = 85  # rendered pages are uploaded as JPEG
+MAX_PX = 2000       # longest side of an upload; bigger pages only slow rendering and the upload
+LONG_SIDE_STEPS = (1024, 1600, 2000)  # rendered long sides round up to one of these (MAX_PX at most)
+SPARSE_COVERAGE = 0.3  # pages whose content covers less than this share are rendered smaller
+TRANSLATE_TABS = 4  # pages translated concurrently, one tab each
+TRANSLATE_ORIGIN = "https://translate.google.com"
+
+# Evaluated in the page: find the Copy text button, empty the clipboard, click, then poll every
+# 10ms (for up to ~1s) until the copied text shows up. "" if the page has no such button.
+COPY_TEXT_JS = """async () => {
+    const btn = [...document.querySelectorAll("button")]
+        .find(b => /copy text/i.test(b.getAttribute("aria-label") || b.textContent));
+    if (!btn) return "";
+    await navigator.clipboard.writeText("");
+    btn.click();
+    for (let i = 0; i < 100; i++) {
+        const text = await navigator.clipboard.readText();
+        if (text) return text;
+        await new Promise(r => setTimeout(r, 10));
+    }
+    return "";
+}"""
 
 
 def wipe_images_only(folder: Path):
-    if not folder.exists():
-        return
-    for p in folder.iterdir():
-        if p.is_file() and p.suffix.lower() in IMG_EXTS:
-            try:
-                p.unlink(missing_ok=True)
-            except:
-                pass
+    """Delete only image files in folder (keep PDFs and anything else)."""
+    # scandir gives the name and file type straight from the directory listing: no stat() or
+    # Path object per entry
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                name = entry.name
+                dot = name.rfind(".")
+                if dot >= 0 and name[dot:].lower() in IMG_EXTS and entry.is_file(follow_symlinks=False):
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
+    except FileNotFoundError:
+        pass
 
 
 # ------------ Core rendering: PyMuPDF ONLY ------------
-def extract_pages(pdf_path: str, dpi: int, raw_dir: Path, log) -> List[Path]:
+def _is_blank(page) -> bool:
+    """True for pages with no text, images or vector drawings, i.e. nothing to translate."""
+    return not (page.get_text("text").strip() or page.get_images(full=False) or page.get_drawings())
+
+
+def _page_zoom(page, zoom: float) -> Tuple[float, bool]:
     """
-    Render every page of the PDF to PNG using PyMuPDF.
+    Pick the zoom for one page and say whether MAX_PX capped it. Pages whose text and images
+    cover little of the page are rendered at 70% (never below 72 DPI), and the long side is
+    rounded up to the next of LONG_SIDE_STEPS, so a page never loses resolution to the steps.
     """
-    raw_dir.mkdir(parents=True, exist_ok=True)
-    for p in raw_dir.glob("*"):
-        if p.is_file() and p.suffix.lower() in IMG_EXTS:
-            try:
-                p.unlink(missing_ok=True)
-            except:
-                pass
+    long_side = max(page.rect.width, page.rect.height, 1)
+    content = fitz.Rect()
+    for block in page.get_text("blocks"):
+        content |= block[:4]
+    # get_text("blocks") leaves images out; figures and scans carry their text inside them
+    for info in page.get_image_info():
+        content |= info["bbox"]
+    if not content.is_empty and content.get_area() < SPARSE_COVERAGE * page.rect.get_area():
+        zoom = max(1.0, zoom * 0.7)
+
+    px = long_side * zoom
+    if px > MAX_PX:
+        return MAX_PX / long_side, True
+    if px >= LONG_SIDE_STEPS[0]:
+        px = next((step for step in LONG_SIDE_STEPS if step >= px), px)
+        return min(px, MAX_PX) / long_side, False
+    return zoom, False
+
+
+def _render_page(pdf_path: str, page_idx: int, zoom: float) -> Tuple[str, bytes, bool, float, bool]:
+    """
+    Render one page to JPEG bytes. Runs in a worker process, so it opens its own document.
+    Also returns the zoom actually used and whether the page had to be scaled down to MAX_PX.
+    """
+    with fitz.open(pdf_path) as doc:
+        page = doc[page_idx]
+        page_zoom, clamped = _page_zoom(page, zoom)
+        pix = page.get_pixmap(matrix=fitz.Matrix(page_zoom, page_zoom), alpha=False)  # RGB
+        # JPEG encodes much faster than PNG's deflate and keeps the uploads small
+        data = pix.tobytes("jpeg", jpg_quality=JPEG_QUALITY)
+        return f"page-{page_idx + 1:03}.jpg", data, _is_blank(page), page_zoom, clamped
 
-    out_paths: List[Path] = []
-    zoom = max(1.0, dpi / 72.0)
-    mat = fitz.Matrix(zoom, zoom)
 
+def page_count(pdf_path: str) -> int:
     with fitz.open(pdf_path) as doc:
-        total = doc.page_count
-        log(f"Rendering with PyMuPDF → {total} pages → {raw_dir}")
-        for i, page in enumerate(doc, 1):
-            pix = page.get_pixmap(matrix=mat, alpha=False)  # RGB
-            dst = raw_dir / f"page-{i:03}.png"
-            pix.save(dst.as_posix())
-            out_paths.append(dst)
-            log(f"  ✓ {dst.name}")
-
-    if not out_paths:
+        return doc.page_count
+
+
+async def extract_pages(pdf_path: str, dpi: int, log) -> AsyncIterator[Tuple[str, bytes, bool]]:
+    """
+    Render every page of the PDF to JPEG using PyMuPDF and yield (file name, bytes, blank)
+    tuples in page order as soon as each page is ready. The pages stay in memory; they are
+    uploaded straight from these buffers, never from disk. MuPDF holds the GIL while
+    rasterizing, so pages are rendered on a process pool, at most one per worker ahead of
+    the consumer.
+    """
+    zoom = max(1.0, dpi / 72.0)
+    total = page_count(pdf_path)
+    log(f"Rendering with PyMuPDF → {total} pages")
+    if not total:
         raise RuntimeError("No images were produced by PyMuPDF rendering.")
 
-    return out_paths
+    loop = asyncio.get_running_loop()
+    workers = min(total, os.cpu_count() or 1)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        pending = deque()
+        next_idx = 0
+        for _ in range(total):
+            while next_idx < total and len(pending) < workers:
+                pending.append(loop.run_in_executor(pool, _render_page, pdf_path, next_idx, zoom))
+                next_idx += 1
+            name, data, blank, used_zoom, clamped = await pending.popleft()
+            if clamped:
+                log(f"⚠ {name} is very large; rendered at {used_zoom * 72:.0f} DPI to stay within {MAX_PX}px")
+            log(f"  ✓ {name}")
+            yield name, data, blank
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
 
 
 # ------------ DOCX writer ------------
@@ -105,143 +191,297 @@ class DocxLogger:
         section.left_margin = Cm(2.12)
         section.right_margin = Cm(2.12)
 
-        # Normal style
-        normal = self.doc.styles["Normal"]
-        nf = normal.font
-        nf.name = "Segoe UI"
-        nf.size = Pt(10)
-
-        pf = normal.paragraph_format
-        pf.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        pf.space_before = Pt(0)
-        pf.space_after = Pt(0)
-        pf.line_spacing = 1.33
+        # Segoe UI 10pt, justified, no spacing, 1.33 lines: set once as the document defaults
+        # instead of as direct formatting on every paragraph and run
+        defaults = self.doc.styles.element.find(qn("w:docDefaults"))
+        rpr = defaults.find(qn("w:rPrDefault")).find(qn("w:rPr"))
+        rpr.remove(rpr.get_or_add_rFonts())
+        rfonts = rpr.get_or_add_rFonts()
+        for attr in ("w:ascii", "w:hAnsi", "w:eastAsia", "w:cs"):
+            rfonts.set(qn(attr), "Segoe UI")
+        rpr.sz_val = Pt(10)
+        for szcs in rpr.findall(qn("w:szCs")):
+            szcs.set(qn("w:val"), "20")
+
+        ppr = defaults.find(qn("w:pPrDefault")).find(qn("w:pPr"))
+        ppr.jc_val = WD_ALIGN_PARAGRAPH.JUSTIFY
+        ppr.spacing_before = Pt(0)
+        ppr.spacing_after = Pt(0)
+        ppr.spacing_line = Twips(319)  # 1.33 lines of 240 twips
+        ppr.spacing_lineRule = WD_LINE_SPACING.MULTIPLE
+
+        # Headings keep their bold/colour but take font, size and spacing from the defaults
+        for level in (1, 2):
+            style = self.doc.styles[f"Heading {level}"].element
+            for el in style.xpath("./w:rPr/w:rFonts | ./w:rPr/w:sz | ./w:rPr/w:szCs | ./w:pPr/w:spacing"):
+                el.getparent().remove(el)
 
         if title:
-            p = self.doc.add_heading(title, level=1)
-            p.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-            self._force_para_font(p)
+            self.doc.add_heading(title, level=1)
             self.doc.add_paragraph("")
 
-    def _force_para_font(self, para):
-        for run in para.runs:
-            run.font.name = "Segoe UI"
-            run.font.size = Pt(10)
-        para.paragraph_format.space_before = Pt(0)
-        para.paragraph_format.space_after = Pt(0)
-        para.paragraph_format.line_spacing = 1.33
-        para.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+        # Paragraph templates, detached from the body. add_section clones these as XML
+        # instead of creating every paragraph and run through the python-docx API.
+        heading = self.doc.add_heading("", level=2)
+        heading.add_run()
+        line = self.doc.add_paragraph()
+        line.add_run()
+        self._heading_tpl = self._template(heading)
+        self._line_tpl = self._template(line)
+        self._blank_tpl = self._template(self.doc.add_paragraph(""))
+
+        # Sections are built on a writer thread so the translate loop never waits on XML work;
+        # the queue keeps them in the order add_section was called
+        self._sections = queue.SimpleQueue()
+        self._writer = Thread(target=self._write_sections, daemon=True)
+        self._writer.start()
+
+    def _template(self, para):
+        para._p.getparent().remove(para._p)
+        return para._p
+
+    def _clone(self, tpl, text: str = None):
+        p = deepcopy(tpl)
+        if text is not None:
+            p.r_lst[0].text = text
+        return p
 
     def add_section(self, heading: str, text: str):
-        hp = self.doc.add_heading(heading, level=2)
-        hp.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        self._force_para_font(hp)
+        self._sections.put((heading, text))
+
+    def _write_sections(self):
+        while (item := self._sections.get()) is not None:
+            self._append_section(*item)
 
+    def _append_section(self, heading: str, text: str):
+        paras = [self._clone(self._heading_tpl, heading)]
         for line in text.splitlines():
-            p = self.doc.add_paragraph(line if line.strip() else "")
-            p.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-            self._force_para_font(p)
+            paras.append(self._clone(self._line_tpl, line) if line.strip() else self._clone(self._blank_tpl))
+        paras.append(self._clone(self._blank_tpl))
+
+        # New paragraphs go before the body's trailing sectPr, like add_paragraph() does
+        body = self.doc.element.body
+        sect_pr = body.sectPr
+        if sect_pr is None:
+            body.extend(paras)
+        else:
+            for p in paras:
+                sect_pr.addprevious(p)
 
-        sp = self.doc.add_paragraph("")
-        sp.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        self._force_para_font(sp)
+    def close(self):
+        """Wait for the queued sections to be written. Safe to call more than once."""
+        if self._writer.is_alive():
+            self._sections.put(None)
+            self._writer.join()
 
     def save(self):
-        for p in self.doc.paragraphs:
-            if p.paragraph_format.alignment != WD_ALIGN_PARAGRAPH.JUSTIFY:
-                p.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-            self._force_para_font(p)
+        self.close()
+        # Formatting lives in the document defaults, so there is nothing to re-apply here
         self.doc.save(self.path.as_posix())
 
 
 # ------------ Translate via Google Translate Images (Playwright) ------------
+# One headless Chromium shared by every translate_pdf call in this process; starting
+# Playwright and the browser costs seconds, so it is done once and reused
+_BROWSER_POOL: dict = {}
+_BROWSER_LOCK = asyncio.Lock()
+
+
+async def get_browser():
+    """Return the shared browser, starting Playwright and Chromium on first use."""
+    async with _BROWSER_LOCK:
+        browser = _BROWSER_POOL.get("browser")
+        if browser is None or not browser.is_connected():
+            if "pw" not in _BROWSER_POOL:
+                _BROWSER_POOL["pw"] = await async_playwright().start()
+            browser = await _BROWSER_POOL["pw"].chromium.launch(
+                headless=True,  # important for server use
+                args=["--no-sandbox", "--disable-dev-shm-usage"],
+                # Downloads land next to the run folders, so moving one into place is a rename
+                downloads_path=str(app_base_dir() / "downloads"),
+            )
+            _BROWSER_POOL["browser"] = browser
+        return browser
+
+
+async def shutdown_browser():
+    """Close the shared browser and stop Playwright (call on app exit)."""
+    async with _BROWSER_LOCK:
+        browser = _BROWSER_POOL.pop("browser", None)
+        pw = _BROWSER_POOL.pop("pw", None)
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        if pw is not None:
+            try:
+                await pw.stop()
+            except Exception:
+                pass
+
+
 async def translate_images(
-    img_paths: List[Path],
+    pages: asyncio.Queue,
+    total: int,
     target_lang: str,
     close_browser: bool,
     trans_dir: Path,
     log=None,
     docx_logger: Optional[DocxLogger] = None,
+    tabs: int = TRANSLATE_TABS,
 ) -> List[Path]:
+    """
+    Translate the rendered pages through Google Translate (Images), up to `tabs` pages at a
+    time in separate tabs of one browser context. Results come back in page order.
+    Pages are taken from the `pages` queue as the renderer produces them; None marks the end.
+    Blank pages are not uploaded; their rendering is kept as-is.
+    """
     trans_dir.mkdir(parents=True, exist_ok=True)
-    for p in trans_dir.glob("*"):
-        if p.is_file() and p.suffix.lower() in IMG_EXTS:
-            try:
-                p.unlink(missing_ok=True)
-            except:
-                pass
+    wipe_images_only(trans_dir)
 
-    results: List[Path] = []
-    url = f"https://translate.google.com/?sl=auto&tl={target_lang}&op=images"
+    results: dict = {}   # page number -> translated image
+    url = f"{TRANSLATE_ORIGIN}/?sl=auto&tl={target_lang}&op=images"
 
-    async with async_playwright() as pw:
-        browser = await pw.chromium.launch(
-            headless=True,  # important for server use
-            args=["--no-sandbox", "--disable-dev-shm-usage"]
-        )
+    browser = await get_browser()
+    ctx = await browser.new_context(accept_downloads=True)
+    try:
         try:
-            page = await browser.new_page()
+            await ctx.grant_permissions(["clipboard-read", "clipboard-write"], origin=TRANSLATE_ORIGIN)
+        except Exception:
+            pass
+
+        # The clipboard is shared by every tab, so copy + read must not interleave
+        clipboard_lock = asyncio.Lock()
+        page_numbers = itertools.count(1)
+        texts: dict = {}      # page number -> (page name, copied text), waiting for the DOCX
+        next_text = 1
+
+        def add_texts():
+            # Keep the DOCX sections in page order even though tabs finish out of order
+            nonlocal next_text
+            while next_text in texts:
+                name, copied = texts.pop(next_text)
+                next_text += 1
+                if copied and docx_logger:
+                    docx_logger.add_section(name, copied.strip())
+                    log(f"Added text for {name} to DOCX")
+
+        async def translate_tab():
+            page = await ctx.new_page()
             await page.goto(url)
 
-            download_btn = page.get_by_role("button", name="Download translation")
-            copy_btn_css = page.locator('button[aria-label="Copy text"]')
-
-            for img in img_paths:
-                log(f"Processing {img.name}...")
-                await page.locator('input[type="file"]').set_input_files(str(img))
-
-                await download_btn.first.wait_for(state="visible", timeout=60000)
-                async with page.expect_download() as dl_info:
-                    await download_btn.first.click()
-                dl = await dl_info.value
-                out_img = trans_dir / f"{img.stem}-translated.png"
-                await dl.save_as(str(out_img))
-                results.append(out_img)
-
-                copied = ""
-                try:
-                    if await copy_btn_css.count():
-                        await copy_btn_css.first.click()
-                        await page.wait_for_timeout(150)
-                        copied = await page.evaluate("navigator.clipboard.readText()")
-                except Exception:
-                    copied = ""
+            # Locators are lazy queries; build them once per tab instead of once per page
+            file_input   = page.locator('input[type="file"]').first
+            download_btn = page.get_by_role("button", name="Download translation").first
 
-                if copied and docx_logger:
-                    docx_logger.add_section(img.name, copied.strip())
-                    log(f"Added text for {img.name} to DOCX")
+            try:
+                # Tabs pull the next rendered page off the shared queue until the end marker
+                while (item := await pages.get()) is not None:
+                    if isinstance(item, Exception):
+                        raise item
+                    idx = next(page_numbers)
+                    name, data, blank = item
+                    if blank:
+                        # Nothing on the page for Google to translate; skip the round trip
+                        out_img = trans_dir / name
+                        out_img.write_bytes(data)
+                        results[idx] = out_img
+                        texts[idx] = (name, "")
+                        add_texts()
+                        log(f"Skipping blank {name}")
+                        continue
+
+                    log(f"Processing {name}...")
+                    await file_input.set_input_files(
+                        {"name": name, "mimeType": "image/jpeg", "buffer": data}
+                    )
+
+                    await download_btn.wait_for(state="visible", timeout=60000)
+                    async with page.expect_download() as dl_info:
+                        await download_btn.click()
+                    dl = await dl_info.value
+                    out_img = trans_dir / f"{Path(name).stem}-translated.png"
+                    try:
+                        # Take over Playwright's finished download instead of copying it
+                        os.replace(await dl.path(), out_img)
+                    except OSError:
+                        await dl.save_as(str(out_img))
+                    results[idx] = out_img
 
-            await page.close()
-        finally:
-            await browser.close()
+                    copied = ""
+                    try:
+                        async with clipboard_lock:
+                            await page.bring_to_front()
+                            copied = await page.evaluate(COPY_TEXT_JS)
+                    except Exception:
+                        copied = ""
+
+                    texts[idx] = (name, copied)
+                    add_texts()
+
+                # Let the other tabs see the end marker too
+                pages.put_nowait(None)
+            finally:
+                await page.close()
+
+        workers = [asyncio.create_task(translate_tab()) for _ in range(max(1, min(tabs, total)))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for w in workers:
+                w.cancel()
+            raise
+    finally:
+        await ctx.close()
+        # The browser is shared across calls; only tear it down when asked to
+        if close_browser:
+            await shutdown_browser()
 
-    return results
+    return [results[i] for i in sorted(results)]
 
 
 # ------------ PDF Builder ------------
+JPEG_MAGIC = b"\xff\xd8\xff"
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+
+def _as_jpeg_bytes(p: Path) -> bytes:
+    """Decode an image once and re-encode it to JPEG in memory; img2pdf embeds JPEG as-is."""
+    buf = io.BytesIO()
+    with Image.open(p) as im:
+        im.convert("RGB").save(buf, "JPEG", quality=90)
+    return buf.getvalue()
+
+
+def _img2pdf_input(p: Path, flatten_png: bool = False):
+    # Sniff the real format instead of trusting the suffix: JPEG/PNG go through untouched
+    with open(p, "rb") as f:
+        head = f.read(8)
+    if head.startswith(JPEG_MAGIC) or (head == PNG_MAGIC and not flatten_png):
+        return str(p)
+    return _as_jpeg_bytes(p)
+
+
 def build_pdf(images: List[Path], out_pdf: Path, log):
     log("Building final PDF…")
-    normalized: List[Path] = []
-    for p in images:
-        if p.suffix.lower() in (".png", ".jpg", ".jpeg"):
-            normalized.append(p)
-        else:
-            with Image.open(p) as im:
-                q = p.with_suffix(".png")
-                im.save(q)
-                normalized.append(q)
+    # Stream straight into the file instead of building the whole PDF in memory first
     with open(out_pdf, "wb") as f:
-        f.write(img2pdf.convert([str(p) for p in normalized]))
+        try:
+            img2pdf.convert([_img2pdf_input(p) for p in images], outputstream=f)
+        except (img2pdf.ImageOpenError, img2pdf.AlphaChannelError):
+            # e.g. a PNG with transparency; re-encode everything that is not already JPEG
+            f.seek(0); f.truncate()
+            img2pdf.convert([_img2pdf_input(p, flatten_png=True) for p in images], outputstream=f)
     log(f"✓ Saved → {out_pdf}")
 
 
 # ------------ Main Translator ------------
-async def translate_pdf(input_pdf: str, output_pdf: str, target_lang: str = "en", dpi: int = 150, close_browser: bool = True, log=print):
+async def translate_pdf(input_pdf: str, output_pdf: str, target_lang: str = "en", dpi: int = 150, close_browser: bool = False, log=print):
     if not Path(input_pdf).is_file():
         raise FileNotFoundError(f"File not found: {input_pdf}")
 
     run_dir = new_run_dir()
-    raw_dir = run_dir / "raw"
     trans_dir = run_dir / "translated"
 
     try:
@@ -254,16 +494,35 @@ async def translate_pdf(input_pdf: str, output_pdf: str, target_lang: str = "en"
     docx_path = Path(output_pdf).with_suffix(".docx")
     docx_logger = DocxLogger(docx_path, title="Translated Text")
 
-    pages = extract_pages(input_pdf, dpi, raw_dir, log)
-    translated = await translate_images(pages, target_lang, close_browser, trans_dir, log, docx_logger)
-    build_pdf(translated, Path(output_pdf), log)
+    # Render and translate as a pipeline: uploads start while later pages are still rendering.
+    # The bounded queue keeps the renderer at most a few pages ahead of the browser tabs.
+    pages: asyncio.Queue = asyncio.Queue(maxsize=4)
+
+    async def render():
+        try:
+            async for page in extract_pages(input_pdf, dpi, log):
+                await pages.put(page)
+        except Exception as e:
+            await pages.put(e)  # surface render errors in translate_images
+            return
+        await pages.put(None)
+
+    renderer = asyncio.create_task(render())
+    try:
+        translated = await translate_images(pages, page_count(input_pdf), target_lang, close_browser, trans_dir, log, docx_logger)
+    finally:
+        renderer.cancel()
+        docx_logger.close()
+    # Writing the PDF and DOCX is blocking file work; keep it off the event loop so a server
+    # running several translations at once stays responsive
+    await asyncio.to_thread(build_pdf, translated, Path(output_pdf), log)
 
     try:
-        docx_logger.save()
+        await asyncio.to_thread(docx_logger.save)
         log(f"✓ Saved DOCX → {docx_path}")
     except Exception as e:
         log(f"⚠ Could not save DOCX: {e}")
 
-    wipe_images_only(raw_dir)
-    wipe_images_only(trans_dir)
-    log(f"Cleaned up temporary images in {run_dir}.")
+    # The run directory is private to this run; drop the whole tree off the critical path
+    Thread(target=shutil.rmtree, args=(run_dir,), kwargs={"ignore_errors": True}, daemon=True).start()
+    log(f"Cleaning up temporary images in {run_dir}.")
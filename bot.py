@@ -1,17 +1,16 @@
 # translate_pdf_via_gui.py  – Aug 2025
 # - Starts (or attaches to) Chrome via CDP so a new TAB opens in your window
-# - PDF -> page PNGs in RAW_DIR
+# - PDF -> page JPEGs in RAW_DIR
 # - Uploads each page to Google Translate (Images), waits 3s, downloads translated image
 # - Builds a single PDF from the translated images
 # - Wipes PNG/JPG/etc. from RAW_DIR and TRANS_DIR and CLOSES the browser window
 
 import asyncio, os, pathlib, img2pdf, sys, shutil, time, subprocess, re
 from pathlib import Path
-from mimetypes import guess_type
-from urllib.request import urlopen
-from urllib.error import URLError
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import http.client
 
-from pdf2image import convert_from_path, pdfinfo_from_path
+import fitz  # PyMuPDF
 from playwright.async_api import async_playwright, TimeoutError as PWTimeout
 from dotenv import load_dotenv
 load_dotenv()
@@ -19,10 +18,15 @@ load_dotenv()
 # ====== FOLDERS / PATHS ======
 RAW_DIR   = pathlib.Path(r"H:\Bot\raw images")
 TRANS_DIR = pathlib.Path(r"H:\Bot\translated images")
-POPPLER   = pathlib.Path(
-    r"H:\Downloads\Oppo Amos EP040\Release-24.08.0-0\poppler-24.08.0\Library\bin"
-)
 URL = "https://translate.google.co.in/?sl=auto&tl=en&op=images"
+# Processes rendering pages side by side; set RENDER_WORKERS in .env to limit it
+RENDER_WORKERS = int(os.getenv("RENDER_WORKERS") or os.cpu_count() or 1)
+TRANSLATE_TABS = 4  # images translated at the same time, one tab each
+DOWNLOAD_RE = re.compile(r"Download translation|Download", re.I)
+CLEAR_RE    = re.compile(r"Clear image|Clear", re.I)
+# Pages are uploaded as JPEG with the long side capped; a fraction of the PNG bytes to send
+JPEG_QUALITY = 85
+MAX_PX = 2000
 
 RAW_DIR.mkdir(parents=True, exist_ok=True)
 TRANS_DIR.mkdir(parents=True, exist_ok=True)
@@ -41,11 +45,15 @@ EDGE_CANDIDATES = [
 USER_DATA_DIR = Path(os.environ.get("LOCALAPPDATA", r"C:\Users\Public")) / "Chrome" / "PWProfile"
 
 def _debugger_ready() -> bool:
+    # A single short request: a refused connection just means Chrome isn't listening yet
+    conn = http.client.HTTPConnection("localhost", DEBUG_PORT, timeout=0.5)
     try:
-        with urlopen(f"{REMOTE}/json/version", timeout=1.5) as r:
-            return r.status == 200
-    except URLError:
+        conn.request("GET", "/json/version")
+        return conn.getresponse().status == 200
+    except (OSError, http.client.HTTPException):
         return False
+    finally:
+        conn.close()
 
 def _find_browser_exe() -> str:
     for p in CHROME_CANDIDATES + EDGE_CANDIDATES:
@@ -69,127 +77,290 @@ def _launch_chrome_if_needed():
     if sys.platform.startswith("win"):
         creationflags = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
     subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=creationflags)
-    for _ in range(60):
+    # Poll with backoff (50ms → 500ms) for up to 15s
+    deadline = time.monotonic() + 15
+    delay = 0.05
+    while time.monotonic() < deadline:
         if _debugger_ready():
             return
-        time.sleep(0.25)
+        time.sleep(delay)
+        delay = min(0.5, delay * 2)
     raise TimeoutError("Could not start Chrome with remote debugging port.")
 
 # ====== HELPERS ======
-IMG_EXTS = {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tif", ".tiff"}
+IMG_EXTS = frozenset({".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tif", ".tiff"})
+
+def _unlink_quietly(path: str):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
 
 def wipe_images_only(folder: Path):
     """Delete only image files in folder (keep PDFs and anything else)."""
-    if not folder.exists():
+    # File type comes from the dirent itself, so there is no per-file stat()
+    try:
+        with os.scandir(folder) as entries:
+            victims = [entry.path for entry in entries
+                       if os.path.splitext(entry.name)[1].lower() in IMG_EXTS
+                       and entry.is_file(follow_symlinks=False)]
+    except FileNotFoundError:
         return
-    for p in folder.iterdir():
-        try:
-            if p.is_file() and p.suffix.lower() in IMG_EXTS:
-                p.unlink(missing_ok=True)
-        except Exception:
-            pass
+    # Deletes are mostly waiting on the filesystem (slow on NTFS), so a few run at once
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(_unlink_quietly, victims))
+
+def _link_or_copy(src: Path, dst: Path):
+    _unlink_quietly(str(dst))
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+async def save_download(dl, dst: Path):
+    """Hard-link a finished download into place; Playwright's copy is the fallback."""
+    try:
+        src = Path(await dl.path())
+        await asyncio.to_thread(_link_or_copy, src, dst)
+    except Exception:
+        await dl.save_as(dst)
 
 # ====== PDF → IMAGES ======
-def extract_pages(pdf_path: str, dpi: int = 150) -> list[str]:
-    info = pdfinfo_from_path(pdf_path, poppler_path=str(POPPLER))
-    print(f"🔍  {info['Pages']} pages – saving PNGs into {RAW_DIR}")
+def page_count(pdf_path: str) -> int:
+    with fitz.open(pdf_path) as doc:
+        return doc.page_count
+
+def _needs_translation(page) -> bool:
+    # Only truly blank pages are kept as rendered. A few CJK characters can be a whole heading,
+    # images may be scans with text in them, and vector drawings may be text turned into outlines.
+    return bool(page.get_text("text").strip() or page.get_images(full=False) or page.get_drawings())
+
+def _render_page(pdf_path: str, idx: int, dpi: int) -> tuple[str, bool]:
+    # Rendered in-process by MuPDF (one document per worker call); the pixmap is written as JPEG directly
+    out = RAW_DIR / f"page-{idx + 1:03}.jpg"
+    with fitz.open(pdf_path) as doc:
+        page = doc[idx]
+        zoom = min(dpi / 72, MAX_PX / max(page.rect.width, page.rect.height))
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+        # Pages kept as rendered go into the PDF as is; tag the real DPI so img2pdf sizes them right
+        pix.set_dpi(round(zoom * 72), round(zoom * 72))
+        pix.save(str(out), jpg_quality=JPEG_QUALITY)
+        return str(out), _needs_translation(page)
+
+def extract_pages(pdf_path: str, dpi: int = 150, on_page=None) -> list[str]:
+    """Render every page to RAW_DIR; on_page(idx, path, translate) is called as each one is saved."""
+    pages = page_count(pdf_path)
+    print(f"🔍  {pages} pages – saving JPEGs into {RAW_DIR}")
     # fresh RAW_DIR
     shutil.rmtree(RAW_DIR, ignore_errors=True)
     RAW_DIR.mkdir(parents=True, exist_ok=True)
 
-    paths = []
-    for i, pg in enumerate(
-        convert_from_path(pdf_path, dpi=dpi, fmt="png", poppler_path=str(POPPLER)), 1
-    ):
-        out = RAW_DIR / f"page-{i:03}.png"
-        pg.save(out)
-        paths.append(str(out))
-        print(f"   ✓ {out.name}")
+    paths = [None] * pages
+    with ProcessPoolExecutor(max_workers=max(1, min(pages, RENDER_WORKERS))) as pool:
+        futures = {pool.submit(_render_page, pdf_path, i, dpi): i for i in range(pages)}
+        # Hand pages on in completion order; the index keeps track of where each belongs
+        for fut in as_completed(futures):
+            idx, (out, translate) = futures[fut], fut.result()
+            paths[idx] = out
+            print(f"   ✓ {Path(out).name}")
+            if on_page:
+                on_page(idx, out, translate)
     return paths
 
 # ====== TRANSLATE EACH IMAGE VIA GOOGLE TRANSLATE (Images) ======
-async def translate_images(img_paths: list[str]) -> list[str]:
+class PagePool:
+    """Translate tabs opened and navigated once, then handed out one image at a time."""
+
+    def __init__(self, ctx, size: int):
+        self.ctx = ctx
+        self.size = size
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._pages = []
+        # page -> (file input, Browse, Download, Clear); locators are lazy, so these stay valid
+        # across reloads and are built once per tab instead of once per image
+        self.controls = {}
+
+    async def _open(self):
+        page = await self.ctx.new_page()
+        self._pages.append(page)
+        self.controls[page] = (
+            page.locator('input[type="file"]'),
+            page.get_by_role("button", name="Browse your files"),
+            page.get_by_role("button", name=DOWNLOAD_RE).first,
+            page.get_by_role("button", name=CLEAR_RE).first,
+        )
+        await page.goto(URL)
+        return page
+
+    async def start(self):
+        for page in await asyncio.gather(*(self._open() for _ in range(self.size))):
+            self._idle.put_nowait(page)
+
+    async def acquire(self):
+        return await self._idle.get()
+
+    async def release(self, page):
+        # Clear the canvas for the next image; if that fails, reload the tab instead
+        clear_btn = self.controls[page][3]
+        try:
+            if await clear_btn.is_visible():
+                await clear_btn.click(timeout=5000)
+        except Exception:
+            await page.goto(URL)
+        self._idle.put_nowait(page)
+
+    async def close(self):
+        for page in self._pages:
+            try:
+                await page.close()
+            except Exception:
+                pass
+
+# One CDP attach per process, reused by every PDF; attaching and tearing down costs seconds
+_PW = None
+_BROWSER = None
+
+async def get_browser():
+    """Return the attached Chrome, starting/attaching only on first use or after a disconnect."""
+    global _PW, _BROWSER
+    if _BROWSER is None or not _BROWSER.is_connected():
+        # Ensure Chrome with remote debugging is running
+        _launch_chrome_if_needed()
+        if _PW is None:
+            _PW = await async_playwright().start()
+        _BROWSER = await _PW.chromium.connect_over_cdp(REMOTE)
+    return _BROWSER
+
+async def shutdown_browser():
+    """Close the attached Chrome window and stop Playwright (call once, on exit)."""
+    global _PW, _BROWSER
+    browser, pw, _BROWSER, _PW = _BROWSER, _PW, None, None
+    if browser is not None:
+        try:
+            await browser.close()
+        except Exception:
+            pass
+    if pw is not None:
+        try:
+            await pw.stop()
+        except Exception:
+            pass
+
+async def translate_images(raw_q: asyncio.Queue, total: int) -> list[str]:
+    """
+    Translate (idx, path, translate) items from raw_q as they arrive, until None; an Exception
+    item is re-raised. Pages with translate=False go into the PDF as rendered.
+    """
     # fresh TRANS_DIR
     shutil.rmtree(TRANS_DIR, ignore_errors=True)
     TRANS_DIR.mkdir(parents=True, exist_ok=True)
-    translated: list[str] = []
+    translated: list[str] = [None] * total
+
+    # Attached once per process and reused; new tabs open in the same window
+    browser = await get_browser()
+    ctx = browser.contexts[0] if browser.contexts else await browser.new_context(accept_downloads=True)
+    pool = PagePool(ctx, min(TRANSLATE_TABS, total) or 1)
+    await pool.start()
+    saves: list[asyncio.Task] = []
 
-    # Ensure Chrome with remote debugging is running
-    _launch_chrome_if_needed()
+    async def save(dl_file, out_png: Path, idx: int):
+        await save_download(dl_file, out_png)
+        translated[idx] = str(out_png)
+        print(f"   ✓ saved {out_png.name}")
 
-    async with async_playwright() as p:
-        # Attach to that Chrome and open a NEW TAB in the same window
-        browser = await p.chromium.connect_over_cdp(REMOTE)
+    async def translate_one(idx: int, img: str):
+        # Waits for a free, already-loaded tab; at most TRANSLATE_TABS images are in flight
+        page = await pool.acquire()
         try:
-            ctx = browser.contexts[0] if browser.contexts else await browser.new_context(accept_downloads=True)
-            page = await ctx.new_page()
-            await page.goto(URL)
+            file_input, browse_btn, download_btn, _ = pool.controls[page]
 
-            browse_btn   = page.get_by_role("button", name="Browse your files")
-            download_btn = page.get_by_role("button", name=re.compile(r"Download translation|Download", re.I))
-            clear_btn    = page.get_by_role("button", name=re.compile(r"Clear image|Clear", re.I))
-
-            for idx, img in enumerate(img_paths, 1):
-                print(f"🌐  Translating {idx}/{len(img_paths)} …")
-
-                # Choose file (prefer direct input with FilePayload)
-                payload = {
-                    "name": Path(img).name,
-                    "mimeType": guess_type(Path(img).name)[0] or "application/octet-stream",
-                    "buffer": Path(img).read_bytes(),
-                }
-                try:
-                    await page.locator('input[type="file"]').set_input_files(payload, timeout=2000)
-                except Exception:
-                    async with page.expect_file_chooser() as fc_info:
-                        await browse_btn.click()
-                    chooser = await fc_info.value
-                    await chooser.set_files(payload)
-
-                # Wait for Download button to appear
-                await download_btn.first.wait_for(state="visible", timeout=60000)
-
-                # Click Download & capture file
-                async with page.expect_download() as dl_info:
-                    await download_btn.first.click()
-                dl_file = await dl_info.value
-                suggested = dl_file.suggested_filename or f"{Path(img).stem}-translated.png"
-                ext = Path(suggested).suffix or ".png"
-                out_png = TRANS_DIR / f"{Path(img).stem}-translated{ext}"
-                await dl_file.save_as(out_png)
-                translated.append(str(out_png))
-                print(f"   ✓ saved {out_png.name}")
-
-                # Clear canvas if the button exists
-                try:
-                    await clear_btn.click()
-                except Exception:
-                    pass
-
-            await page.close()
-        finally:
-            # 🔚 Close the attached Chrome window itself
+            print(f"🌐  Translating {idx + 1}/{total} …")
+
+            # Choose file (prefer direct input); passing the path lets Playwright read and
+            # upload it, so the image never goes through Python or blocks the event loop
             try:
-                await browser.close()
+                await file_input.set_input_files(img, timeout=2000)
             except Exception:
-                pass
+                async with page.expect_file_chooser() as fc_info:
+                    await browse_btn.click()
+                chooser = await fc_info.value
+                await chooser.set_files(img)
+
+            # Wait for Download button to appear
+            await download_btn.wait_for(state="visible", timeout=60000)
+
+            # Click Download & capture file
+            async with page.expect_download() as dl_info:
+                await download_btn.click()
+            dl_file = await dl_info.value
+            suggested = dl_file.suggested_filename or f"{Path(img).stem}-translated.png"
+            ext = Path(suggested).suffix or ".png"
+            out_png = TRANS_DIR / f"{Path(img).stem}-translated{ext}"
+            # Copying the file out runs in the background; the tab goes straight on to the next upload
+            saves.append(asyncio.create_task(save(dl_file, out_png, idx)))
+        finally:
+            await pool.release(page)
+
+    async def translator():
+        while (item := await raw_q.get()) is not None:
+            if isinstance(item, Exception):
+                raise item
+            idx, img, translate = item
+            if translate:
+                await translate_one(idx, img)
+            else:
+                translated[idx] = img
+                print(f"   ↷ page {idx + 1} has no text to translate, kept as-is")
+        raw_q.put_nowait(None)  # let the other translators see the end too
+
+    # Results land by index, so the PDF keeps page order whatever finishes first
+    try:
+        await asyncio.gather(*(translator() for _ in range(pool.size)))
+        await asyncio.gather(*saves)
+    finally:
+        for task in saves:
+            task.cancel()
+        await pool.close()
 
     return translated
 
 # ====== IMAGES → SINGLE PDF ======
 def build_pdf(img_paths: list[str], pdf_out: str):
     print("📚  Building final PDF …")
+    # img2pdf opens the paths itself and writes each page straight to the file, so the
+    # translated images are never all held in memory at once
     with open(pdf_out, "wb") as f:
-        f.write(img2pdf.convert([open(p, "rb").read() for p in img_paths]))
+        img2pdf.convert(img_paths, outputstream=f, engine=img2pdf.Engine.internal)
     print(f"🎉  Saved → {pdf_out}")
 
 # ====== MAIN ======
-async def main(src_pdf: str, out_pdf: str):
+async def main(src_pdf: str, out_pdf: str, dpi: int = 150):
     if not os.path.isfile(src_pdf):
         sys.exit(f"❌ File not found: {src_pdf}")
 
-    raw_imgs   = extract_pages(src_pdf, dpi=150)
-    trans_imgs = await translate_images(raw_imgs)
+    # Pipeline: pages go to the translator tabs as soon as each JPEG is rendered, so rendering
+    # (CPU) and translating (network) overlap instead of running back to back
+    loop = asyncio.get_running_loop()
+    raw_q: asyncio.Queue = asyncio.Queue()
+
+    def on_page(idx: int, path: str, translate: bool):
+        loop.call_soon_threadsafe(raw_q.put_nowait, (idx, path, translate))
+
+    async def render():
+        try:
+            await asyncio.to_thread(extract_pages, src_pdf, dpi, on_page)
+        except Exception as e:
+            raw_q.put_nowait(e)
+            return
+        raw_q.put_nowait(None)
+
+    renderer = asyncio.create_task(render())
+    try:
+        trans_imgs = await translate_images(raw_q, page_count(src_pdf))
+    finally:
+        renderer.cancel()
+        # 🔚 Close the attached Chrome window itself
+        await shutdown_browser()
     build_pdf(trans_imgs, out_pdf)
 
     # 🧹 wipe ONLY images in both folders (keep your resulting PDF even if it’s in TRANS_DIR)
@@ -205,6 +376,8 @@ if __name__ == "__main__":
     parser.add_argument("input_pdf",  help="Path to source PDF")
     parser.add_argument("output_pdf", nargs="?", default="translated.pdf",
                         help="Filename for translated PDF")
+    parser.add_argument("--dpi", type=int, default=150,
+                        help="Render resolution (long side is still capped at MAX_PX)")
     args = parser.parse_args()
 
-    asyncio.run(main(args.input_pdf, args.output_pdf))
+    asyncio.run(main(args.input_pdf, args.output_pdf, args.dpi))
@@ -6,9 +6,26 @@ from docx import Document
 from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+
+# rFonts attributes set for every script, so Latin, complex and East Asian text all switch font
+RFONTS_ATTRS = tuple(qn(f'w:{attr}') for attr in ('ascii', 'hAnsi', 'cs', 'eastAsia'))
+BODY_FONT, BODY_SIZE = 'Segoe UI', Pt(10)
+QN_P, QN_T = qn('w:p'), qn('w:t')
+DATE_PLACEHOLDER = "[DATE]"
+# Descendant searches for inline images, run by lxml instead of serializing the paragraph
+XPATH_DRAWING, XPATH_PICT = './/' + qn('w:drawing'), './/' + qn('w:pict')
 
 # --- Helper Functions ---
 
+def set_run_font(run, font_name, font_size):
+    """Sets font name and size on a run by writing its rPr element directly."""
+    rpr = run._r.get_or_add_rPr()
+    rfonts = rpr.get_or_add_rFonts()
+    for attr in RFONTS_ATTRS:
+        rfonts.set(attr, font_name)
+    rpr.sz_val = font_size
+
 def set_cell_alignment(cell, alignment):
     """Sets the alignment for all paragraphs within a cell."""
     for p in cell.paragraphs:
@@ -21,43 +38,55 @@ def set_cell_font_style(cell, is_italic=False, is_bold=False):
             run.italic = is_italic
             run.bold = is_bold
             
+def upper_cell_text(cell):
+    """Upper-cases a cell's text run by run, keeping its paragraphs and run formatting."""
+    for p in cell.paragraphs:
+        for run in p.runs:
+            if run.text:
+                run.text = run.text.upper()
+
+def has_image(p_el):
+    """True if the <w:p> element holds a drawing or legacy VML picture."""
+    return p_el.find(XPATH_DRAWING) is not None or p_el.find(XPATH_PICT) is not None
+
 def get_table_headers(table):
     """Extracts and cleans header text from the first row of a table."""
     if not table.rows:
         return []
-    return [cell.text.strip().lower() for cell in table.rows[0].cells]
+    # Text is read straight from the <w:t> elements, without Paragraph/Run wrappers per cell
+    return ['\n'.join(''.join(t.text or '' for t in p_el.iter(QN_T)) for p_el in cell._tc.iterchildren(QN_P)).strip().casefold()
+            for cell in table.rows[0].cells]
 
 # --- Core Formatting Logic ---
 
-def format_paragraphs_and_headings(doc):
-    """Formats all paragraphs and headings according to specified rules."""
+def format_body(doc):
+    """Formats all paragraphs and headings and centers inline images, in one walk over the body."""
     in_heading_1_section = False
+    body = doc._body
     
-    for p in doc.paragraphs:
+    for p_el in doc.element.body.iterchildren(QN_P):
+        p = Paragraph(p_el, body)
         style_name = p.style.name
         
         if style_name.startswith('Heading'):
             in_heading_1_section = False
             if style_name == 'Heading 1':
                 in_heading_1_section = True
-                font_name, font_size = 'Cambria', 28
+                font_name, font_size = 'Cambria', Pt(28)
             elif style_name == 'Heading 2':
-                font_name, font_size = 'Cambria', 20
+                font_name, font_size = 'Cambria', Pt(20)
             elif style_name == 'Heading 3':
-                font_name, font_size = 'Cambria', 14
+                font_name, font_size = 'Cambria', Pt(14)
             else:
                 font_name = None
 
             if font_name:
                 for run in p.runs:
-                    run.font.name = font_name
-                    rpr = run._r.get_or_add_rPr()
-                    rpr.rFonts.set(qn('w:cs'), font_name)
-                    rpr.rFonts.set(qn('w:eastAsia'), font_name)
-                    run.font.size = Pt(font_size)
+                    set_run_font(run, font_name, font_size)
         
         else: # This block handles all non-heading paragraphs
-            is_special_font = any(run.font.name in ['Wingdings', 'Wingdings 2', 'Symbol'] for run in p.runs)
+            runs = p.runs
+            is_special_font = any(run.font.name in ['Wingdings', 'Wingdings 2', 'Symbol'] for run in runs)
             
             if not is_special_font:
                 p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
@@ -65,12 +94,8 @@ def format_paragraphs_and_headings(doc):
                 pf.space_before = Pt(0)
                 pf.space_after = Pt(0)
                 
-                for run in p.runs:
-                    run.font.name = 'Segoe UI'
-                    run.font.size = Pt(10)
-                    rpr = run._r.get_or_add_rPr()
-                    rpr.rFonts.set(qn('w:cs'), 'Segoe UI')
-                    rpr.rFonts.set(qn('w:eastAsia'), 'Segoe UI')
+                for run in runs:
+                    set_run_font(run, BODY_FONT, BODY_SIZE)
 
             if in_heading_1_section and not style_name.startswith('Heading'):
                 pf = p.paragraph_format
@@ -78,104 +103,126 @@ def format_paragraphs_and_headings(doc):
                 pf.space_before = Pt(6)
                 pf.space_after = Pt(6)
 
+        # Images are centered last so they override the justified body alignment
+        if has_image(p_el):
+            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+def _format_claim_table(table, header_idx):
+    claim_idx = header_idx["claim element"]
+    for row in table.rows:
+        for i, cell in enumerate(row.cells):
+            alignment = WD_ALIGN_PARAGRAPH.JUSTIFY if i == claim_idx else WD_ALIGN_PARAGRAPH.CENTER
+            set_cell_alignment(cell, alignment)
+
+def _format_inpadoc_table(table, header_idx):
+    pub_idx = header_idx["publication number"]
+    for row in table.rows:
+        for i, cell in enumerate(row.cells):
+            alignment = WD_ALIGN_PARAGRAPH.CENTER if i == pub_idx else WD_ALIGN_PARAGRAPH.JUSTIFY
+            set_cell_alignment(cell, alignment)
+
+def _format_centered_table(table, header_idx):
+    for row in table.rows:
+        for cell in row.cells:
+            set_cell_alignment(cell, WD_ALIGN_PARAGRAPH.CENTER)
+
+def _format_key_string_table(table, header_idx):
+    logic_idx, key_idx = header_idx["logic"], header_idx["key-string"]
+    for r_idx, row in enumerate(table.rows):
+        for c_idx, cell in enumerate(row.cells):
+            if c_idx == logic_idx: set_cell_alignment(cell, WD_ALIGN_PARAGRAPH.LEFT)
+            elif c_idx == key_idx:
+                set_cell_alignment(cell, WD_ALIGN_PARAGRAPH.JUSTIFY)
+                if r_idx > 0: upper_cell_text(cell)
+            else: set_cell_alignment(cell, WD_ALIGN_PARAGRAPH.CENTER)
+
+def _format_search_string_table(table, header_idx):
+    search_idx = header_idx["search string"]
+    for row in table.rows:
+        for c_idx, cell in enumerate(row.cells):
+            alignment = WD_ALIGN_PARAGRAPH.LEFT if c_idx == search_idx else WD_ALIGN_PARAGRAPH.CENTER
+            set_cell_alignment(cell, alignment)
+
+def _format_name_table(table, header_idx):
+    name_idx = header_idx["name"]
+    for r_idx, row in enumerate(table.rows):
+        if r_idx == 0: continue
+        if len(row.cells) > name_idx:
+            cell = row.cells[name_idx]
+            upper_cell_text(cell)
+            set_cell_alignment(cell, WD_ALIGN_PARAGRAPH.CENTER)
+
+def _format_relevance_table(table, header_idx):
+    rel_idx = header_idx["potential relevance"]
+    for r_idx, row in enumerate(table.rows):
+        for c_idx, cell in enumerate(row.cells):
+            if c_idx == rel_idx:
+                set_cell_alignment(cell, WD_ALIGN_PARAGRAPH.CENTER)
+                if r_idx > 0: set_cell_font_style(cell, is_italic=True)
+            else: set_cell_alignment(cell, WD_ALIGN_PARAGRAPH.JUSTIFY)
+
+def _format_key_value_table(table):
+    expected_labels = ["Publication Date", "Filing Date", "Abstract", "Relevant Text"]
+    actual_labels = [table.cell(i, 0).text.strip() for i in range(4)]
+    if actual_labels == expected_labels:
+        print("Found specific key-value table. Formatting column 2...")
+        for i in range(4):
+            target_cell = table.cell(i, 1)
+            for p in target_cell.paragraphs:
+                if has_image(p._p):
+                    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                else:
+                    p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+                    for run in p.runs:
+                        if run.font.name not in ['Wingdings', 'Wingdings 2', 'Symbol']:
+                            run.font.name = 'Segoe UI'
+                            run.font.size = Pt(10)
+
+# Checked in order; the first match wins. A frozenset matches when all of its headers are
+# present, a tuple only when the header row is exactly that.
+TABLE_RULES = [
+    (frozenset({"claim element"}), _format_claim_table),
+    (frozenset({"publication number", "inpadoc family members"}), _format_inpadoc_table),
+    (frozenset({"publication number", "title", "priority date", "filing date", "publication date", "inventor(s)", "assignee(s)"}), _format_centered_table),
+    (frozenset({"#", "title", "publication date", "source", "author(s)"}), _format_centered_table),
+    (frozenset({"logic", "key-string", "hits"}), _format_key_string_table),
+    (frozenset({"search string"}), _format_search_string_table),
+    (("#", "name"), _format_name_table),
+    (("#", "claim element", "example sections", "analyst’s comment", "potential relevance"), _format_relevance_table),
+]
+
 def format_tables(doc):
     """Identifies and formats tables based on their headers or structure."""
     for table in doc.tables:
         headers = get_table_headers(table)
-        
-        if "claim element" in headers:
-            try:
-                claim_idx = headers.index("claim element")
-                for row in table.rows:
-                    for i, cell in enumerate(row.cells):
-                        alignment = WD_ALIGN_PARAGRAPH.JUSTIFY if i == claim_idx else WD_ALIGN_PARAGRAPH.CENTER
-                        set_cell_alignment(cell, alignment)
-            except ValueError: pass
-        elif "publication number" in headers and "inpadoc family members" in headers:
-            try:
-                pub_idx = headers.index("publication number")
-                for row in table.rows:
-                    for i, cell in enumerate(row.cells):
-                        alignment = WD_ALIGN_PARAGRAPH.CENTER if i == pub_idx else WD_ALIGN_PARAGRAPH.JUSTIFY
-                        set_cell_alignment(cell, alignment)
-            except ValueError: pass
-        elif all(h in headers for h in ["publication number", "title", "priority date", "filing date", "publication date", "inventor(s)", "assignee(s)"]):
-            for row in table.rows:
-                for cell in row.cells:
-                    set_cell_alignment(cell, WD_ALIGN_PARAGRAPH.CENTER)
-        elif all(h in headers for h in ["#", "title", "publication date", "source", "author(s)"]):
-             for row in table.rows:
-                for cell in row.cells:
-                    set_cell_alignment(cell, WD_ALIGN_PARAGRAPH.CENTER)
-        elif all(h in headers for h in ["logic", "key-string", "hits"]):
-            try:
-                logic_idx, key_idx = headers.index("logic"), headers.index("key-string")
-                for r_idx, row in enumerate(table.rows):
-                    for c_idx, cell in enumerate(row.cells):
-                        if c_idx == logic_idx: set_cell_alignment(cell, WD_ALIGN_PARAGRAPH.LEFT)
-                        elif c_idx == key_idx:
-                            set_cell_alignment(cell, WD_ALIGN_PARAGRAPH.JUSTIFY)
-                            if r_idx > 0: cell.text = cell.text.upper()
-                        else: set_cell_alignment(cell, WD_ALIGN_PARAGRAPH.CENTER)
-            except ValueError: pass
-        elif "search string" in headers:
-             for r_idx, row in enumerate(table.rows):
-                for c_idx, cell in enumerate(row.cells):
-                    alignment = WD_ALIGN_PARAGRAPH.LEFT if c_idx == headers.index("search string") else WD_ALIGN_PARAGRAPH.CENTER
-                    set_cell_alignment(cell, alignment)
-        elif headers == ["#", "name"]:
-            try:
-                name_idx = headers.index("name")
-                for r_idx, row in enumerate(table.rows):
-                    if r_idx == 0: continue
-                    if len(row.cells) > name_idx:
-                        cell = row.cells[name_idx]
-                        cell.text = cell.text.upper()
-                        set_cell_alignment(cell, WD_ALIGN_PARAGRAPH.CENTER)
-            except ValueError: pass
-        elif headers == ["#", "claim element", "example sections", "analyst’s comment", "potential relevance"]:
-            try:
-                rel_idx = headers.index("potential relevance")
-                for r_idx, row in enumerate(table.rows):
-                    for c_idx, cell in enumerate(row.cells):
-                        if c_idx == rel_idx:
-                            set_cell_alignment(cell, WD_ALIGN_PARAGRAPH.CENTER)
-                            if r_idx > 0: set_cell_font_style(cell, is_italic=True)
-                        else: set_cell_alignment(cell, WD_ALIGN_PARAGRAPH.JUSTIFY)
-            except ValueError: pass
-        elif len(table.columns) == 2 and len(table.rows) >= 4:
-            expected_labels = ["Publication Date", "Filing Date", "Abstract", "Relevant Text"]
-            actual_labels = [table.cell(i, 0).text.strip() for i in range(4)]
-            if actual_labels == expected_labels:
-                print("Found specific key-value table. Formatting column 2...")
-                for i in range(4):
-                    target_cell = table.cell(i, 1)
-                    for p in target_cell.paragraphs:
-                        if 'w:drawing' in p._p.xml or 'w:pict' in p._p.xml:
-                            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                        else:
-                            p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-                            for run in p.runs:
-                                if run.font.name not in ['Wingdings', 'Wingdings 2', 'Symbol']:
-                                    run.font.name = 'Segoe UI'
-                                    run.font.size = Pt(10)
-
-def format_images(doc):
-    """Centers all inline images in the document."""
-    for p in doc.paragraphs:
-        if 'w:drawing' in p._p.xml or 'w:pict' in p._p.xml:
-            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        header_set, header_key = frozenset(headers), tuple(headers)
+        header_idx = {}
+        for i, h in enumerate(headers):
+            header_idx.setdefault(h, i)  # first column wins, like list.index
+
+        for signature, handler in TABLE_RULES:
+            if signature == header_key if isinstance(signature, tuple) else signature <= header_set:
+                handler(table, header_idx)
+                break
+        else:
+            if len(table.columns) == 2 and len(table.rows) >= 4:
+                _format_key_value_table(table)
 
 def format_headers_and_footers(doc):
     """Updates the date in headers and footers."""
     current_date = datetime.datetime.now().strftime("%B %d, %Y")
-    date_placeholder = "[DATE]" 
+    # Linked sections share one header part; it only needs to be visited once
+    seen = set()
     for section in doc.sections:
         for header in (section.header, section.first_page_header, section.even_page_header):
-            if header:
-                for p in header.paragraphs:
-                    if date_placeholder in p.text:
-                        p.text = p.text.replace(date_placeholder, current_date)
+            element = header._element
+            if element in seen:
+                continue
+            seen.add(element)
+            for p in header.paragraphs:
+                text = p.text
+                if DATE_PLACEHOLDER in text:
+                    p.text = text.replace(DATE_PLACEHOLDER, current_date)
 
 def update_doc_properties(doc, filepath):
     """Updates document properties based on the filename."""
@@ -193,15 +240,12 @@ def process_document(input_path):
     """Main function to apply all formatting rules to a DOCX file."""
     doc = Document(input_path)
     
-    print("Formatting paragraphs and headings...")
-    format_paragraphs_and_headings(doc)
+    print("Formatting paragraphs, headings and images...")
+    format_body(doc)
     
     print("Formatting tables...")
     format_tables(doc)
     
-    print("Centering images...")
-    format_images(doc)
-    
     print("Updating headers and footers...")
     format_headers_and_footers(doc)
     
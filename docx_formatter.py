@@ -7,17 +7,170 @@ Applies comprehensive formatting rules while preserving document structure.
 """
 
 import os
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from docx import Document
 from docx.shared import Pt, RGBColor
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
 from docx.enum.table import WD_TABLE_ALIGNMENT, WD_CELL_VERTICAL_ALIGNMENT
 from docx.oxml import parse_xml
-from docx.oxml.ns import nsdecls, qn
+from docx.oxml.ns import nsdecls, nsmap, qn
+from docx.text.paragraph import Paragraph
+from lxml import etree
+from copy import deepcopy
+from functools import lru_cache
 import re
 
 
+# Shared length/colour values; these are immutable, so one instance serves every run
+_PT0, _PT6, _PT9, _PT10 = Pt(0), Pt(6), Pt(9), Pt(10)
+_BLACK = RGBColor(0, 0, 0)
+
+# Heading style -> run formatting
+_HEADING_FORMATS = {
+    'Heading 1': {'size': Pt(28), 'bold': True, 'color': _BLACK},
+    'Heading 2': {'size': Pt(20), 'bold': True, 'color': _BLACK},
+    'Heading 3': {'size': Pt(14), 'bold': True, 'color': _BLACK},
+}
+
+# Parsed once per font and deep-copied into runs that have no <w:rFonts> yet
+_RFONTS_TEMPLATES = {
+    name: parse_xml(f'<w:rFonts {nsdecls("w")} w:ascii="{name}" w:hAnsi="{name}" w:cs="{name}"/>')
+    for name in ('Segoe UI', 'Cambria')
+}
+_RFONTS_ATTRS = (qn('w:ascii'), qn('w:hAnsi'), qn('w:cs'))
+_RFONTS_LATIN = _RFONTS_ATTRS[:2]  # what run.font.name sets; table cells keep their own cs font
+
+# One compiled query for "holds an image" (modern drawing, legacy VML picture, or blip)
+_IMAGE_XPATH = etree.XPath(
+    'boolean(.//w:drawing | .//w:pict | .//a:blip)',
+    namespaces={'w': nsmap['w'], 'a': nsmap['a']},
+)
+_QN_P, _QN_T = qn('w:p'), qn('w:t')
+_DATE_PLACEHOLDER = '[DATE]'
+
+# Body run formatting as it appears in rPr once applied: Segoe UI on all three slots,
+# 10pt (w:sz is in half-points) and plain black
+_BODY_RUN_XPATH = etree.XPath(
+    'concat(w:rFonts/@w:ascii, "|", w:rFonts/@w:hAnsi, "|", w:rFonts/@w:cs, "|", w:sz/@w:val, "|", '
+    'w:color/@w:val, "|", count(w:color/@*))',
+    namespaces={'w': nsmap['w']},
+)
+_BODY_RUN_DONE = 'Segoe UI|Segoe UI|Segoe UI|20|000000|1'
+
+
+def _rfonts_template(font_name):
+    """Parsed <w:rFonts> for a font, created once per font name."""
+    template = _RFONTS_TEMPLATES.get(font_name)
+    if template is None:
+        template = _RFONTS_TEMPLATES[font_name] = parse_xml(
+            f'<w:rFonts {nsdecls("w")} w:ascii="{font_name}" '
+            f'w:hAnsi="{font_name}" w:cs="{font_name}"/>')
+    return template
+
+
+def _format_run(r, font_name, size, bold=None, color=None, font_attrs=_RFONTS_ATTRS):
+    """
+    Apply font, size and optionally bold/colour straight to a <w:r> element's rPr.
+    
+    Same result as the run.font setters, without building a Run/Font wrapper and going
+    through their descriptors for every run.
+    
+    Args:
+        r: The <w:r> element to modify
+        font_name: Font for Latin and complex-script text
+        size: Font size (Length)
+        bold: True/False to set bold, None to leave it
+        color: RGBColor to set, None to leave it
+        font_attrs: rFonts attributes that get font_name
+    """
+    rPr = r.get_or_add_rPr()
+    rFonts = rPr.rFonts
+    if rFonts is None and font_attrs is _RFONTS_ATTRS:
+        rPr._insert_rFonts(deepcopy(_rfonts_template(font_name)))
+    else:
+        rFonts = rPr.get_or_add_rFonts()
+        for attr in font_attrs:
+            rFonts.set(attr, font_name)
+    rPr.sz_val = size
+    if bold is not None:
+        rPr._set_bool_val('b', bold)
+    if color is not None:
+        rPr._remove_color()
+        rPr.get_or_add_color().val = color
+
+
+# Every header keyword in one pattern, so a header row is scanned once instead of once per keyword
+_HEADER_RE = re.compile(
+    r'claim element|publication number|logic|operation|search string|search query|'
+    r'prior art|reference|classification|category'
+)
+
+# Keyword -> table type ('logic' and 'operation' must both appear, see _table_type_for_headers)
+_HEADER_TYPES = {
+    'claim element': 'claim_element',
+    'publication number': 'publication',
+    'search string': 'search_string',
+    'search query': 'search_string',
+    'prior art': 'prior_art',
+    'reference': 'prior_art',
+    'classification': 'classification',
+    'category': 'classification',
+}
+
+# Alignment members bound once; these are used in the per-paragraph and per-cell loops
+_LEFT, _CENTER, _JUSTIFY = WD_ALIGN_PARAGRAPH.LEFT, WD_ALIGN_PARAGRAPH.CENTER, WD_ALIGN_PARAGRAPH.JUSTIFY
+_TABLE_CENTER = WD_TABLE_ALIGNMENT.CENTER
+_VALIGN_CENTER = WD_CELL_VERTICAL_ALIGNMENT.CENTER
+
+# Column alignments for each table type; columns past the end use the last entry
+_TABLE_ALIGNMENTS = {
+    'claim_element': (_JUSTIFY, _JUSTIFY),
+    'publication': (_CENTER, _LEFT, _CENTER),
+    'logic': (_CENTER, _JUSTIFY),
+    'search_string': (_JUSTIFY,),
+    'prior_art': (_LEFT, _JUSTIFY, _CENTER),
+    'classification': (_LEFT, _JUSTIFY),
+    'key_value': (_LEFT, _LEFT),
+    'default': (_LEFT,),
+}
+
+# Symbol fonts whose runs must keep their font (Wingdings, Symbol, ...)
+_SYMBOL_FONT_RE = re.compile(r'symbol|wingdings', re.I)
+
+# When several keywords appear, the earliest type here wins
+_TYPE_PRIORITY = ('claim_element', 'publication', 'logic', 'search_string', 'prior_art', 'classification')
+
+
+@lru_cache(maxsize=256)
+def _table_type_for_headers(headers):
+    """
+    Table type implied by the header keywords alone.
+    
+    Args:
+        headers (tuple): Lower-cased, stripped header cell texts
+        
+    Returns:
+        str: Table type identifier or None
+    """
+    found = set(_HEADER_RE.findall(' '.join(headers)))
+    types = {_HEADER_TYPES[kw] for kw in found if kw in _HEADER_TYPES}
+    if 'logic' in found and 'operation' in found:
+        types.add('logic')
+    for table_type in _TYPE_PRIORITY:
+        if table_type in types:
+            return table_type
+    return None
+
+
+def _format_one(file_path):
+    """Format one file in a worker process (module-level so the pool can pickle it)."""
+    return DocxFormatter(file_path).format_document()
+
+
 class DocxFormatter:
     """Main formatter class for processing Word documents."""
     
@@ -31,6 +184,8 @@ class DocxFormatter:
         self.file_path = file_path
         self.doc = None
         self.output_path = None
+        self._style_names = None
+        self._default_style_name = None
         
     def format_document(self):
         """
@@ -39,13 +194,14 @@ class DocxFormatter:
         Returns:
             str: Path to the formatted document
         """
-        # Load document
-        self.doc = Document(self.file_path)
+        # Load document: one sequential read, then zipfile seeks around in memory rather than
+        # issuing many small reads against the file (slow on mapped/network drives)
+        with open(self.file_path, 'rb') as f:
+            self.doc = Document(BytesIO(f.read()))
         
-        # Apply all formatting rules
-        self.format_paragraphs_and_headings()
+        # Apply all formatting rules (images are centered in the same pass as paragraphs)
+        self.format_paragraphs_and_headings(center_images=True)
         self.format_tables()
-        self.format_images()
         self.update_doc_properties()
         self.format_headers_and_footers()
         
@@ -53,43 +209,106 @@ class DocxFormatter:
         self.output_path = self._generate_output_path()
         self.doc.save(self.output_path)
         
+        # Drop the parsed tree once it is saved; a formatter kept around (or one per file in
+        # a batch) would otherwise hold the whole document in memory
+        self.doc = None
+        self._style_names = None
+        
         return self.output_path
     
+    @classmethod
+    def format_many(cls, file_paths, workers=None):
+        """
+        Format several documents side by side, one worker process per CPU core.
+        
+        Args:
+            file_paths (list): Paths to the input DOCX files
+            workers (int): Number of worker processes (default: CPU count)
+            
+        Returns:
+            list: Paths to the formatted documents, in input order
+        """
+        file_paths = list(file_paths)
+        if len(file_paths) <= 1:
+            return [cls(path).format_document() for path in file_paths]
+        
+        workers = min(workers or os.cpu_count() or 1, len(file_paths))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Batch files per task only when there are many of them, so small runs still spread out
+            chunksize = max(1, len(file_paths) // (workers * 4))
+            return list(pool.map(_format_one, file_paths, chunksize=chunksize))
+    
     def _generate_output_path(self):
         """Generate output file path with '_formatted' suffix."""
         path = Path(self.file_path)
         new_name = f"{path.stem}_formatted{path.suffix}"
         return str(path.parent / new_name)
     
-    def format_paragraphs_and_headings(self):
-        """Format all paragraphs and headings in the document."""
-        previous_style = None
+    def _style_name(self, paragraph):
+        """
+        Name of a paragraph's style, from its w:pStyle id.
         
-        for paragraph in self.doc.paragraphs:
-            # Skip empty paragraphs
-            if not paragraph.text.strip():
-                continue
+        Looks the id up in a map built once per document instead of resolving
+        paragraph.style through the styles part for every paragraph.
+        
+        Args:
+            paragraph: The paragraph to classify
             
-            # Reset spacing to ensure clean formatting
-            paragraph.paragraph_format.space_before = Pt(0)
-            paragraph.paragraph_format.space_after = Pt(0)
-            paragraph.paragraph_format.line_spacing = 1.0
+        Returns:
+            str: Style name, or the default paragraph style's name
+        """
+        if self._style_names is None:
+            styles = self.doc.styles
+            self._style_names = {
+                style.style_id: style.name
+                for style in styles if style.type == WD_STYLE_TYPE.PARAGRAPH
+            }
+            default = styles.default(WD_STYLE_TYPE.PARAGRAPH)
+            self._default_style_name = default.name if default is not None else 'Normal'
+        return self._style_names.get(paragraph._p.style, self._default_style_name)
+    
+    def format_paragraphs_and_headings(self, center_images=False):
+        """
+        Format all paragraphs and headings in the document.
+        
+        Args:
+            center_images (bool): Also center paragraphs holding images, so the body
+                is walked once instead of again by format_images
+        """
+        previous_style = None
+        body = self.doc._body
+        
+        for p in self.doc.element.body.iterchildren(_QN_P):
+            paragraph = Paragraph(p, body)
             
-            # Check if paragraph is a heading
-            if paragraph.style.name.startswith('Heading'):
-                self._format_heading(paragraph)
-                previous_style = paragraph.style.name
-            else:
-                # Format as regular paragraph
-                self._format_regular_paragraph(paragraph)
+            # Empty paragraphs get no text formatting
+            if paragraph.text.strip():
+                # Reset spacing to ensure clean formatting
+                pf = paragraph.paragraph_format
+                pf.space_before = _PT0
+                pf.space_after = _PT0
+                pf.line_spacing = 1.0
                 
-                # Apply special spacing if follows Heading 1
-                if previous_style == 'Heading 1':
-                    paragraph.paragraph_format.line_spacing = 1.33
-                    paragraph.paragraph_format.space_before = Pt(6)
-                    paragraph.paragraph_format.space_after = Pt(6)
+                style_name = self._style_name(paragraph)
                 
-                previous_style = paragraph.style.name
+                # Check if paragraph is a heading
+                if style_name.startswith('Heading'):
+                    self._format_heading(paragraph)
+                else:
+                    # Format as regular paragraph
+                    self._format_regular_paragraph(paragraph)
+                    
+                    # Apply special spacing if follows Heading 1
+                    if previous_style == 'Heading 1':
+                        pf.line_spacing = 1.33
+                        pf.space_before = _PT6
+                        pf.space_after = _PT6
+                
+                previous_style = style_name
+            
+            # Centered after the text formatting, so the image alignment wins
+            if center_images and _IMAGE_XPATH(p):
+                paragraph.alignment = _CENTER
     
     def _format_heading(self, paragraph):
         """
@@ -98,30 +317,17 @@ class DocxFormatter:
         Args:
             paragraph: The paragraph object to format
         """
-        style_name = paragraph.style.name
-        
-        # Define heading formats
-        heading_formats = {
-            'Heading 1': {'size': 28, 'bold': True, 'color': RGBColor(0, 0, 0)},
-            'Heading 2': {'size': 20, 'bold': True, 'color': RGBColor(0, 0, 0)},
-            'Heading 3': {'size': 14, 'bold': True, 'color': RGBColor(0, 0, 0)},
-        }
+        style_name = self._style_name(paragraph)
         
-        if style_name in heading_formats:
-            fmt = heading_formats[style_name]
+        if style_name in _HEADING_FORMATS:
+            fmt = _HEADING_FORMATS[style_name]
             
-            # Apply formatting to all runs in the heading
-            for run in paragraph.runs:
-                run.font.name = 'Cambria'
-                run.font.size = Pt(fmt['size'])
-                run.font.bold = fmt['bold']
-                run.font.color.rgb = fmt['color']
-                
-                # Set font at XML level for better compatibility
-                self._set_font_xml(run, 'Cambria')
+            # Apply formatting to all runs in the heading (at XML level, so it overrides the style)
+            for r in paragraph._p.r_lst:
+                _format_run(r, 'Cambria', fmt['size'], fmt['bold'], fmt['color'])
             
             # Set paragraph alignment
-            paragraph.alignment = WD_ALIGN_PARAGRAPH.LEFT
+            paragraph.alignment = _LEFT
     
     def _format_regular_paragraph(self, paragraph):
         """
@@ -131,42 +337,22 @@ class DocxFormatter:
             paragraph: The paragraph object to format
         """
         # Set paragraph alignment to justified
-        paragraph.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+        paragraph.alignment = _JUSTIFY
         
         # Format each run in the paragraph
-        for run in paragraph.runs:
+        for r in paragraph._p.r_lst:
             # Skip if using symbol fonts (Wingdings, Symbol, etc.)
-            if run.font.name and 'symbol' in run.font.name.lower():
-                continue
-            if run.font.name and 'wingdings' in run.font.name.lower():
+            rPr = r.rPr
+            font_name = rPr.rFonts_ascii if rPr is not None else None
+            if font_name and _SYMBOL_FONT_RE.search(font_name):
                 continue
             
-            # Apply standard formatting
-            run.font.name = 'Segoe UI'
-            run.font.size = Pt(10)
-            run.font.color.rgb = RGBColor(0, 0, 0)
+            # Already formatted (e.g. a document run through the formatter before): nothing to do
+            if font_name == 'Segoe UI' and _BODY_RUN_XPATH(rPr) == _BODY_RUN_DONE:
+                continue
             
-            # Set font at XML level for better compatibility
-            self._set_font_xml(run, 'Segoe UI')
-    
-    def _set_font_xml(self, run, font_name):
-        """
-        Set font at XML level to ensure it overrides style definitions.
-        
-        Args:
-            run: The run object to modify
-            font_name: Name of the font to apply
-        """
-        rPr = run._element.get_or_add_rPr()
-        rFonts = rPr.find(qn('w:rFonts'))
-        if rFonts is None:
-            rFonts = parse_xml(f'<w:rFonts {nsdecls("w")} w:ascii="{font_name}" '
-                              f'w:hAnsi="{font_name}" w:cs="{font_name}"/>')
-            rPr.insert(0, rFonts)
-        else:
-            rFonts.set(qn('w:ascii'), font_name)
-            rFonts.set(qn('w:hAnsi'), font_name)
-            rFonts.set(qn('w:cs'), font_name)
+            # Apply standard formatting (at XML level, so it overrides the style)
+            _format_run(r, 'Segoe UI', _PT10, color=_BLACK)
     
     def format_tables(self):
         """Format all tables in the document based on their content type."""
@@ -194,40 +380,16 @@ class DocxFormatter:
             return None
         
         # Get first row text (headers)
-        headers = []
-        for cell in table.rows[0].cells:
-            headers.append(cell.text.lower().strip())
-        
-        # Check for specific table types based on headers
-        header_text = ' '.join(headers)
+        headers = tuple(cell.text.lower().strip() for cell in table.rows[0].cells)
         
-        # Type 1: Claim element table
-        if 'claim element' in header_text:
-            return 'claim_element'
-        
-        # Type 2: Publication table
-        if 'publication number' in header_text:
-            return 'publication'
-        
-        # Type 3: Logic table
-        if 'logic' in header_text and 'operation' in header_text:
-            return 'logic'
-        
-        # Type 4: Search string table
-        if 'search string' in header_text or 'search query' in header_text:
-            return 'search_string'
-        
-        # Type 5: Prior art table
-        if 'prior art' in header_text or 'reference' in header_text:
-            return 'prior_art'
-        
-        # Type 6: Classification table
-        if 'classification' in header_text or 'category' in header_text:
-            return 'classification'
+        # Types 1-6: claim element, publication, logic, search string, prior art, classification
+        table_type = _table_type_for_headers(headers)
+        if table_type:
+            return table_type
         
         # Type 7: Key-value table (2 columns, specific structure)
         if len(table.columns) == 2 and len(table.rows) > 2:
-            first_col_text = table.rows[0].cells[0].text.lower()
+            first_col_text = headers[0]
             if any(kw in first_col_text for kw in ['publication date', 'title', 'inventor', 'assignee']):
                 return 'key_value'
         
@@ -241,56 +403,40 @@ class DocxFormatter:
             table: The table object to format
             table_type: Type identifier for the table
         """
-        # Define column alignments for each table type
-        alignments = {
-            'claim_element': [WD_ALIGN_PARAGRAPH.JUSTIFY, WD_ALIGN_PARAGRAPH.JUSTIFY],
-            'publication': [WD_ALIGN_PARAGRAPH.CENTER, WD_ALIGN_PARAGRAPH.LEFT, WD_ALIGN_PARAGRAPH.CENTER],
-            'logic': [WD_ALIGN_PARAGRAPH.CENTER, WD_ALIGN_PARAGRAPH.JUSTIFY],
-            'search_string': [WD_ALIGN_PARAGRAPH.JUSTIFY],
-            'prior_art': [WD_ALIGN_PARAGRAPH.LEFT, WD_ALIGN_PARAGRAPH.JUSTIFY, WD_ALIGN_PARAGRAPH.CENTER],
-            'classification': [WD_ALIGN_PARAGRAPH.LEFT, WD_ALIGN_PARAGRAPH.JUSTIFY],
-            'key_value': [WD_ALIGN_PARAGRAPH.LEFT, WD_ALIGN_PARAGRAPH.LEFT],
-            'default': [WD_ALIGN_PARAGRAPH.LEFT]
-        }
-        
         # Get alignment pattern for this table type
-        alignment_pattern = alignments.get(table_type, alignments['default'])
+        alignment_pattern = _TABLE_ALIGNMENTS.get(table_type, _TABLE_ALIGNMENTS['default'])
+        pattern_len, last_alignment = len(alignment_pattern), alignment_pattern[-1]
         
         # Set table alignment
-        table.alignment = WD_TABLE_ALIGNMENT.CENTER
+        table.alignment = _TABLE_CENTER
         
         # Apply formatting to each row
         for row_idx, row in enumerate(table.rows):
             for col_idx, cell in enumerate(row.cells):
-                # Determine alignment for this column
-                if col_idx < len(alignment_pattern):
-                    alignment = alignment_pattern[col_idx]
-                else:
-                    alignment = alignment_pattern[-1]  # Use last pattern for extra columns
+                # Determine alignment for this column (last pattern for extra columns)
+                alignment = alignment_pattern[col_idx] if col_idx < pattern_len else last_alignment
+                tc = cell._tc
                 
                 # Apply alignment to all paragraphs in cell
-                for paragraph in cell.paragraphs:
-                    paragraph.alignment = alignment
+                for p in tc.p_lst:
+                    p.get_or_add_pPr().jc_val = alignment
                     
-                    # Format text in cell
-                    for run in paragraph.runs:
-                        run.font.name = 'Segoe UI'
-                        run.font.size = Pt(9)
-                        
-                        # Bold headers (first row)
+                    # Format text in cell; headers (first row) are bold and a size up
+                    for r in p.r_lst:
                         if row_idx == 0:
-                            run.font.bold = True
-                            run.font.size = Pt(10)
+                            _format_run(r, 'Segoe UI', _PT10, bold=True, font_attrs=_RFONTS_LATIN)
+                        else:
+                            _format_run(r, 'Segoe UI', _PT9, font_attrs=_RFONTS_LATIN)
                 
                 # Set vertical alignment
-                cell.vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.CENTER
+                tc.get_or_add_tcPr().vAlign_val = _VALIGN_CENTER
     
     def format_images(self):
         """Center all inline images in the document."""
         for paragraph in self.doc.paragraphs:
             # Check if paragraph contains an image
             if self._paragraph_has_image(paragraph):
-                paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                paragraph.alignment = _CENTER
     
     def _paragraph_has_image(self, paragraph):
         """
@@ -300,24 +446,9 @@ class DocxFormatter:
             paragraph: The paragraph to check
             
         Returns:
-            bool: True if paragraph contains an image
+            bool: True if paragraph contains a drawing, a legacy picture or a blip
         """
-        # Check for drawing elements (modern image format)
-        drawing_elements = paragraph._element.xpath('.//w:drawing')
-        if drawing_elements:
-            return True
-        
-        # Check for picture elements (legacy image format)
-        pict_elements = paragraph._element.xpath('.//w:pict')
-        if pict_elements:
-            return True
-        
-        # Alternative method: check for graphic data in runs
-        for run in paragraph.runs:
-            if run._element.xpath('.//a:blip'):
-                return True
-        
-        return False
+        return _IMAGE_XPATH(paragraph._element)
     
     def update_doc_properties(self):
         """Update document metadata based on filename."""
@@ -345,15 +476,15 @@ class DocxFormatter:
         """Format headers and footers, replacing date placeholders."""
         current_date = datetime.now().strftime('%B %d, %Y')
         
-        # Process all sections in the document
+        # Process all sections in the document; linked sections share one part, which
+        # only needs to be processed once
+        seen = set()
         for section in self.doc.sections:
-            # Process header
-            if section.header:
-                self._process_header_footer(section.header, current_date)
-            
-            # Process footer
-            if section.footer:
-                self._process_header_footer(section.footer, current_date)
+            for header_footer in (section.header, section.footer):
+                element = header_footer._element
+                if element not in seen:
+                    seen.add(element)
+                    self._process_header_footer(header_footer, current_date)
     
     def _process_header_footer(self, header_footer, current_date):
         """
@@ -363,12 +494,13 @@ class DocxFormatter:
             header_footer: Header or footer object
             current_date: Formatted current date string
         """
-        for paragraph in header_footer.paragraphs:
-            for run in paragraph.runs:
-                # Replace date placeholder
-                if '[DATE]' in run.text:
-                    run.text = run.text.replace('[DATE]', current_date)
+        for p in header_footer._element.iterchildren(_QN_P):
+            for r in p.r_lst:
+                # Replace date placeholder in place, without rebuilding the run's content
+                for t in r.iterchildren(_QN_T):
+                    text = t.text
+                    if text and _DATE_PLACEHOLDER in text:
+                        t.text = text.replace(_DATE_PLACEHOLDER, current_date)
                 
                 # Apply standard formatting
-                run.font.name = 'Segoe UI'
-                run.font.size = Pt(10)
\ No newline at end of file
+                _format_run(r, 'Segoe UI', _PT10, font_attrs=_RFONTS_LATIN)
\ No newline at end of file
@@ -1,11 +1,11 @@
 # bot.py
-import os, time, subprocess, sys
+import os, time, subprocess, sys, asyncio
 from pathlib import Path
+from functools import lru_cache
 from mimetypes import guess_type
-from urllib.request import urlopen
-from urllib.error import URLError
+import http.client
 import re
-from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
+from playwright.async_api import async_playwright, TimeoutError as PWTimeout
 
 # ====== CONFIG ======
 DEBUG_PORT = 9222
@@ -24,16 +24,22 @@ SRC_DIR = Path(r"H:\Bot\raw_images")
 OUT_DIR = Path(r"H:\Bot\Translated Images"); OUT_DIR.mkdir(parents=True, exist_ok=True)
 SOURCE_LANG = "auto"     # or "zh-CN"
 TARGET_LANG = "en"       # change to "hi"/"fr"/etc for visible change
-GLOB = ["*.png", "*.jpg", "*.jpeg", "*.webp", "*.bmp"]
+IMG_EXTS = frozenset({".png", ".jpg", ".jpeg", ".webp", ".bmp"})
+N_TABS = 4               # images translated at the same time, one tab each
 # =====================
 
 def debugger_ready() -> bool:
+    # A single short request: a refused connection just means Chrome isn't listening yet
+    conn = http.client.HTTPConnection("localhost", DEBUG_PORT, timeout=0.5)
     try:
-        with urlopen(f"{REMOTE}/json/version", timeout=1.5) as r:
-            return r.status == 200
-    except URLError:
+        conn.request("GET", "/json/version")
+        return conn.getresponse().status == 200
+    except (OSError, http.client.HTTPException):
         return False
+    finally:
+        conn.close()
 
+@lru_cache(maxsize=1)  # install paths do not move while the app runs
 def find_browser_exe() -> str:
     for p in CHROME_CANDIDATES + EDGE_CANDIDATES:
         if Path(p).is_file():
@@ -58,56 +64,72 @@ def launch_chrome_if_needed():
         creationflags = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
     subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=creationflags)
     # Wait until the debugger port is up
-    for _ in range(60):  # ~15s
+    deadline = time.monotonic() + 15
+    delay = 0.05
+    while time.monotonic() < deadline:
         if debugger_ready():
             return
-        time.sleep(0.25)
+        time.sleep(delay)
+        delay = min(0.5, delay * 2)
     raise TimeoutError("Could not start Chrome with remote debugging port.")
 
 def iter_images():
-    files = []
-    for pat in GLOB:
-        files.extend(SRC_DIR.glob(pat))
+    # One directory listing; file type comes from the dirent, so there is no stat() per entry
+    try:
+        with os.scandir(SRC_DIR) as entries:
+            files = [Path(e.path) for e in entries
+                     if os.path.splitext(e.name)[1].lower() in IMG_EXTS and e.is_file()]
+    except FileNotFoundError:
+        return []
     return sorted(files)
 
-def upload_and_download_one(page, src_path: Path) -> Path:
-    page.goto(f"https://translate.google.co.in/?sl={SOURCE_LANG}&tl={TARGET_LANG}&op=translate",
-              wait_until="domcontentloaded")
-    # Open Images tab
-    page.get_by_role("button", name=re.compile(r"(Image translation|Images)", re.I)).click()
+_MIME_BY_EXT = {}
 
-    # FilePayload (works even if H: is a mapped drive)
-    payload = {
-        "name": src_path.name,
-        "mimeType": guess_type(src_path.name)[0] or "application/octet-stream",
-        "buffer": src_path.read_bytes(),
-    }
+def mime_for(path: Path) -> str:
+    # One mimetypes lookup per extension, not per image
+    ext = path.suffix.lower()
+    mime = _MIME_BY_EXT.get(ext)
+    if mime is None:
+        mime = _MIME_BY_EXT[ext] = guess_type(path.name)[0] or "application/octet-stream"
+    return mime
+
+async def upload_and_download_one(page, src_path: Path) -> Path:
+    await page.goto(f"https://translate.google.co.in/?sl={SOURCE_LANG}&tl={TARGET_LANG}&op=translate",
+                    wait_until="domcontentloaded")
+    # Open Images tab
+    await page.get_by_role("button", name=re.compile(r"(Image translation|Images)", re.I)).click()
 
-    # Upload
+    # Upload by path first: Playwright reads the file itself, with no copy through Python
     try:
-        page.locator('input[type="file"]').set_input_files(payload, timeout=4000)
+        await page.locator('input[type="file"]').set_input_files(str(src_path), timeout=4000)
     except Exception:
-        with page.expect_file_chooser() as fc:
-            page.get_by_role("button", name=re.compile(r"Browse your files", re.I)).click()
-        fc.value.set_files(payload)
+        # FilePayload fallback (works even if H: is a mapped drive the browser can't read)
+        payload = {
+            "name": src_path.name,
+            "mimeType": mime_for(src_path),
+            "buffer": src_path.read_bytes(),
+        }
+        async with page.expect_file_chooser() as fc:
+            await page.get_by_role("button", name=re.compile(r"Browse your files", re.I)).click()
+        await (await fc.value).set_files(payload)
 
     # Wait for controls (the <img> may be hidden)
-    page.get_by_role("button", name=re.compile(r"(Copy text|Show original|Show translated|Download)", re.I)).first.wait_for(timeout=60000)
+    await page.get_by_role("button", name=re.compile(r"(Copy text|Show original|Show translated|Download)", re.I)).first.wait_for(timeout=60000)
 
     # Ensure translated overlay is ON: if "Show translated" is visible, you're on ORIGINAL → click once
     st = page.get_by_text("Show translated", exact=True)
-    if st.count():
-        st.first.click()
+    if await st.count():
+        await st.first.click()
 
     # Prefer the official download
     out_path = OUT_DIR / f"{src_path.stem}_translated.png"
     try:
-        with page.expect_download(timeout=15000) as dl_info:
-            page.get_by_role("button", name=re.compile(r"(Download translation|Download)", re.I)).click()
-        dl = dl_info.value
+        async with page.expect_download(timeout=15000) as dl_info:
+            await page.get_by_role("button", name=re.compile(r"(Download translation|Download)", re.I)).click()
+        dl = await dl_info.value
         ext = Path(dl.suggested_filename).suffix or ".png"
         out_path = OUT_DIR / f"{src_path.stem}_translated{ext}"
-        dl.save_as(str(out_path))
+        await dl.save_as(str(out_path))
         print(f"✓ Downloaded: {src_path.name} → {out_path.name}")
         return out_path
     except PWTimeout:
@@ -118,16 +140,47 @@ def upload_and_download_one(page, src_path: Path) -> Path:
     # Screenshot fallback: panel that contains the viewer (captures overlay)
     panel = page.locator("div").filter(has=page.get_by_role("button", name=re.compile(r"Copy text", re.I))).first
     viewer = panel.locator(":scope div:has(canvas), :scope div:has(img.Jmlpdc)").last
-    target = viewer if viewer.count() and viewer.is_visible() else panel
+    target = viewer if await viewer.count() and await viewer.is_visible() else panel
     try:
-        target.scroll_into_view_if_needed()
+        await target.scroll_into_view_if_needed()
     except Exception:
         pass
-    page.wait_for_timeout(150)
-    target.screenshot(path=str(out_path), animations="disabled")
+    await page.wait_for_timeout(150)
+    await target.screenshot(path=str(out_path), animations="disabled")
     print(f"✓ Screenshotted: {src_path.name} → {out_path.name}")
     return out_path
 
+async def tab_worker(ctx, todo: asyncio.Queue) -> int:
+    # One tab in the shared Chrome window, taking the next image until none are left
+    ok = 0
+    page = await ctx.new_page()  # new tab in the attached browser (new window if no context existed)
+    try:
+        while True:
+            try:
+                src = todo.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            try:
+                await upload_and_download_one(page, src)
+                ok += 1
+            except Exception as e:
+                print(f"✗ Error on {src.name}: {e}")
+    finally:
+        await page.close()
+    return ok
+
+async def translate_all(files) -> int:
+    # A single CDP connection drives every tab: Playwright points Chrome's download folder at a
+    # temp dir of its own, so a second connection would steal the other tabs' downloads
+    async with async_playwright() as pw:
+        browser = await pw.chromium.connect_over_cdp(REMOTE)
+        ctx = browser.contexts[0] if browser.contexts else await browser.new_context()
+        todo = asyncio.Queue()
+        for src in files:
+            todo.put_nowait(src)
+        tabs = min(N_TABS, len(files))
+        return sum(await asyncio.gather(*(tab_worker(ctx, todo) for _ in range(tabs))))
+
 def main():
     files = iter_images()
     if not files:
@@ -137,22 +190,10 @@ def main():
     # 1) Ensure Chrome with remote debugging is running
     launch_chrome_if_needed()
 
-    # 2) Attach and open a NEW TAB in that same window
-    with sync_playwright() as pw:
-        browser = pw.chromium.connect_over_cdp(REMOTE)
-        ctx = browser.contexts[0] if browser.contexts else browser.new_context()
-        page = ctx.new_page()  # new tab in the attached browser (new window if no context existed)
-
-        ok = 0
-        for i, src in enumerate(files, 1):
-            try:
-                upload_and_download_one(page, src)
-                ok += 1
-            except Exception as e:
-                print(f"✗ Error on {src.name}: {e}")
+    # 2) Attach and translate in up to N_TABS tabs of that same window, each taking the next image
+    ok = asyncio.run(translate_all(files))
 
-        page.close()
-        print(f"\nDone. {ok}/{len(files)} images saved to: {OUT_DIR}")
+    print(f"\nDone. {ok}/{len(files)} images saved to: {OUT_DIR}")
 
 if __name__ == "__main__":
     main()
@@ -1,17 +1,33 @@
 from fastapi import FastAPI, UploadFile, Form
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 from pathlib import Path
 from fastapi.responses import HTMLResponse
 import shutil, uuid, asyncio
 import uvicorn
 
-from backup import translate_pdf
+from backup import translate_pdf, shutdown_browser
 
 app = FastAPI(title="PDF Translator Bot 🌍")
 
 UPLOADS = Path("uploads"); UPLOADS.mkdir(exist_ok=True)
 OUTPUTS = Path("outputs"); OUTPUTS.mkdir(exist_ok=True)
 
+# PDFs translated at the same time; each one renders on every core and opens several tabs
+MAX_TRANSLATIONS = 2
+_translate_slots = asyncio.Semaphore(MAX_TRANSLATIONS)
+
+
+def save_upload(src, dest: Path):
+    with open(dest, "wb") as f:
+        shutil.copyfileobj(src, f, 1 << 20)
+
+
+@app.on_event("shutdown")
+async def close_browser():
+    # translate_pdf keeps one headless browser alive between requests
+    await shutdown_browser()
+
 
 @app.get("/", response_class=HTMLResponse)
 async def home():
@@ -35,10 +51,11 @@ async def translate(file: UploadFile, lang: str = Form("en")):
     input_path = UPLOADS / f"{file_id}_{file.filename}"
     output_path = OUTPUTS / f"{file_id}_translated.pdf"
 
-    with open(input_path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
+    # The copy blocks on disk I/O, so it runs in a worker thread instead of on the event loop
+    await run_in_threadpool(save_upload, file.file, input_path)
 
-    await translate_pdf(str(input_path), str(output_path), target_lang=lang, log=print)
+    async with _translate_slots:
+        await translate_pdf(str(input_path), str(output_path), target_lang=lang, log=print)
 
     return FileResponse(output_path, filename=output_path.name)
 
@@ -1,18 +1,17 @@
-import sys, os, re, time, subprocess, asyncio, shutil
+import sys, os, io, re, time, subprocess, asyncio, shutil, itertools, socket, queue, hashlib
 from urllib.request import urlopen
 from urllib.error import URLError
 from pathlib import Path
-from mimetypes import guess_type
 from threading import Thread
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import freeze_support
+from collections import deque
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional
 
 import img2pdf
-from pdf2image import convert_from_path, pdfinfo_from_path
-from PIL import Image, ImageStat
-try:
-    import fitz  # PyMuPDF fallback renderer
-except Exception:
-    fitz = None
+from PIL import Image
+import fitz  # PyMuPDF
 
 from playwright.async_api import async_playwright, TimeoutError as PWTimeout
 import tkinter as tk
@@ -48,32 +47,71 @@ def new_run_dir() -> Path:
     (d / "translated").mkdir(parents=True, exist_ok=True)
     return d
 
-# POPPLER location resolver: use bundled folder in EXE, else env var / common paths
-def resolve_poppler_bin() -> Path:
-    # In bundled EXE (PyInstaller)
-    if getattr(sys, "_MEIPASS", None):
-        p = Path(sys._MEIPASS) / "poppler_bin"
-        if p.exists():
-            return p
+CACHE_MAX_AGE_DAYS = 30  # cached PDFs not translated again for this long are dropped
 
-    # Dev/installed fallbacks (custom dev path first)
-    candidates = [
-        Path(r"H:\Bot\poppler-24.08.0\Library\bin"),   # DEV PATH (custom)
-        Path(os.environ.get("POPPLLER_BIN", "")),      # common typo guard
-        Path(os.environ.get("POPPLER_BIN", "")),
-        Path(r"C:\Program Files\poppler\bin"),
-        Path(r"C:\Program Files (x86)\poppler\bin"),
-        Path("/usr/local/bin"),
-        Path("/usr/bin"),
-    ]
-    for c in candidates:
-        if c and c.exists():
-            return c
+def cache_root() -> Path:
+    return app_base_dir() / "cache"
+
+def prune_translation_cache(max_age_days: float = CACHE_MAX_AGE_DAYS):
+    """Drop cached PDFs that have not been used for `max_age_days`."""
+    cutoff = time.time() - max_age_days * 86400
+    try:
+        with os.scandir(cache_root()) as it:
+            stale = [de.path for de in it if de.is_dir(follow_symlinks=False) and de.stat().st_mtime < cutoff]
+    except FileNotFoundError:
+        return
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+
+def clear_translation_cache():
+    shutil.rmtree(cache_root(), ignore_errors=True)
+
+def translation_cache_dir(pdf_path: str, target_lang: str, dpi: int) -> Path:
+    """Translated pages of this exact PDF (by content hash) for one language and DPI."""
+    h = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    prune_translation_cache()
+    d = cache_root() / h.hexdigest() / f"{target_lang}-{dpi}"
+    d.mkdir(parents=True, exist_ok=True)
+    os.utime(d.parent)  # the age limit counts from the last run that used this PDF
+    return d
+
+def cached_pages(cache_dir: Path) -> dict:
+    """Page number -> (translated image, copied text) for every page fully stored in the cache."""
+    images, texts = {}, {}
+    with os.scandir(cache_dir) as it:
+        for de in it:
+            stem, ext = os.path.splitext(de.name)
+            if not stem.startswith("page-") or not stem[5:].isdigit():
+                continue
+            if ext == ".txt":
+                texts[int(stem[5:])] = Path(de.path)
+            elif ext.lower() in IMG_EXTS:
+                images[int(stem[5:])] = Path(de.path)
+    return {idx: (img, texts[idx]) for idx, img in images.items() if idx in texts}
+
+def link_or_copy(src: Path, dst: Path):
+    """Hard-link when both paths are on one filesystem, copy otherwise."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+async def save_download(dl, dst: Path):
+    """Hard-link a finished download into place; Playwright's copy is the fallback."""
+    try:
+        src = Path(await dl.path())
+        await asyncio.to_thread(link_or_copy, src, dst)
+    except Exception:
+        await dl.save_as(str(dst))
 
-    raise FileNotFoundError(
-        "Poppler not found. Bundle 'poppler_bin' with the EXE, "
-        "set POPPLER_BIN env var, or install Poppler."
-    )
+def store_cached(cache_dir: Path, idx: int, img: Path, copied: str):
+    # The text file goes last: cached_pages only trusts pages that have one
+    link_or_copy(img, cache_dir / f"page-{idx:03}{img.suffix}")
+    (cache_dir / f"page-{idx:03}.txt").write_text(copied, encoding="utf-8")
 
 # Chrome remote debugging attach
 DEBUG_PORT = 9222
@@ -89,19 +127,65 @@ EDGE_CANDIDATES = [
 USER_DATA_DIR = Path(os.environ.get("LOCALAPPDATA", r"C:\Users\Public")) / "Chrome" / "PWProfile"
 
 IMG_EXTS = {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".tif", ".tiff"}
+JPEG_QUALITY = 85  # rendered pages are uploaded as JPEG
+MAX_PX = 4000       # longest side of a rendered page; caps memory for posters and oversized scans
+TRANSLATE_TABS = 4  # pages translated concurrently, one tab each
+
+# Google Translate (Images) button names, compiled once for every tab
+BROWSE_RE   = re.compile(r"Browse your files", re.I)
+DOWNLOAD_RE = re.compile(r"(Download translation|Download)", re.I)
+CLEAR_RE    = re.compile(r"(Clear image|Clear)", re.I)
+
+# Runs in the page: find the Copy text button (by aria-label or label text, like the role locator),
+# clear the clipboard, click, then poll until the copied text lands (up to ~1s). Returns "" when
+# there is no button. One round trip instead of existence checks + click + sleep + separate read.
+COPY_TEXT_JS = """async () => {
+    const btn = [...document.querySelectorAll("button")]
+        .find(b => /copy text/i.test(b.getAttribute("aria-label") || b.textContent));
+    if (!btn) return "";
+    await navigator.clipboard.writeText("");
+    btn.click();
+    for (let i = 0; i < 100; i++) {
+        const text = await navigator.clipboard.readText();
+        if (text) return text;
+        await new Promise(r => setTimeout(r, 10));
+    }
+    return "";
+}"""
 
 # ------------ Helpers ------------
+def wipe_images_only(folder: Path):
+    """Delete only image files in folder (keep anything else)."""
+    # os.scandir gets the file type from the directory listing, so there is no stat() per entry
+    try:
+        with os.scandir(folder) as it:
+            victims = [de.path for de in it
+                       if os.path.splitext(de.name)[1].lower() in IMG_EXTS and de.is_file(follow_symlinks=False)]
+    except FileNotFoundError:
+        return
+    for path in victims:
+        try: os.unlink(path)
+        except OSError: pass
+
+def dbg_port_open(timeout: float = 0.05) -> bool:
+    """Cheap TCP probe of the debugging port; no HTTP round-trip."""
+    try:
+        with socket.create_connection(("localhost", DEBUG_PORT), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
 def dbg_ready() -> bool:
+    # Only ask DevTools for /json/version once something is listening on the port
+    if not dbg_port_open():
+        return False
     try:
         with urlopen(f"{REMOTE}/json/version", timeout=1.5) as r:
             return r.status == 200
-    except Exception:
-        try:
-            with urlopen(f"{REMOTE}/json/version", timeout=1.5) as r:
-                return r.status == 200
-        except URLError:
-            return False
+    except (URLError, OSError):
+        return False
 
+@lru_cache(maxsize=1)  # install paths do not move while the app runs
 def find_browser_exe() -> str:
     for p in CHROME_CANDIDATES + EDGE_CANDIDATES:
         if Path(p).is_file():
@@ -126,234 +210,341 @@ def launch_chrome_if_needed(log):
         creationflags = subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
     subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=creationflags)
     log("Launching Chrome ...Grab A Coffee , Sit Back & Relax")
-    for _ in range(60):
+    # Poll with exponential backoff (20ms → 500ms) for up to 15s
+    deadline = time.monotonic() + 15
+    delay = 0.02
+    while time.monotonic() < deadline:
         if dbg_ready():
             log("Let me do the boring stuff now!Meanwhile you can disturb your co-worker 😈 Just Suggesting 😂")
             return
-        time.sleep(0.25)
+        time.sleep(delay)
+        delay = min(0.5, delay * 1.5)
     raise TimeoutError("Could not start Chrome with remote debugging port.")
 
-def wipe_images_only(folder: Path):
-    if not folder.exists():
-        return
-    for p in folder.iterdir():
-        if p.is_file() and p.suffix.lower() in IMG_EXTS:
-            try: p.unlink(missing_ok=True)
-            except: pass
+# ------------ Core pipeline ------------
+def _is_grey(rgb) -> bool:
+    return rgb is None or rgb[0] == rgb[1] == rgb[2]
 
-# ---- Render validation & MuPDF fallback (fixes "blank PNGs" from OCR'd PDFs) ----
-def is_mostly_blank(img_path: Path, thresh: float = 0.995) -> bool:
-    try:
-        with Image.open(img_path) as im:
-            im = im.convert("L")
-            stat = ImageStat.Stat(im)
-            mean = stat.mean[0]
-            var = stat.var[0]
-            if mean > 250 and var < 5:
-                small = im.resize((max(1, im.width // 16), max(1, im.height // 16)))
-                pixels = list(small.getdata())
-                nonwhite = sum(1 for p in pixels if p < 248)
-                ratio = nonwhite / len(pixels)
-                return ratio < (1 - thresh)
-            return False
-    except Exception:
+def _is_monochrome(page) -> bool:
+    """True for pages with no raster images whose text and vector art are all black/grey."""
+    if page.get_images(full=False):
         return False
-
-def render_with_pymupdf(pdf_path: str, dpi: int, out_dir: Path, log) -> List[Path]:
-    if fitz is None:
-        raise RuntimeError("PyMuPDF (fitz) not installed. pip install pymupdf")
-    out_paths: List[Path] = []
-    zoom = dpi / 72.0
-    mat = fitz.Matrix(zoom, zoom)
-    log("Re-rendering with MuPDF (fallback)…")
+    for block in page.get_text("dict")["blocks"]:
+        for line in block.get("lines", ()):
+            for span in line["spans"]:
+                c = span["color"]
+                if not _is_grey((c >> 16 & 0xFF, c >> 8 & 0xFF, c & 0xFF)):
+                    return False
+    return all(_is_grey(d.get("color")) and _is_grey(d.get("fill")) for d in page.get_drawings())
+
+def _render_page(pdf_path: str, page_idx: int, dpi: int, out_path: str) -> float:
+    """
+    Render a single page to JPEG and return the DPI actually used. Runs in a worker process,
+    so it opens its own document. Oversized pages are scaled down to MAX_PX on the long side.
+    """
     with fitz.open(pdf_path) as doc:
-        for i, page in enumerate(doc, 1):
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-            dst = out_dir / f"page-{i:03}.png"
-            pix.save(dst.as_posix())
-            out_paths.append(dst)
-            log(f"  ✓ (MuPDF) {dst.name}")
-    return out_paths
-
-# ------------ Core pipeline ------------
-def extract_pages(pdf_path: str, dpi: int, raw_dir: Path, log) -> List[Path]:
-    """First try Poppler (pdf2image). If pages look blank, fallback to MuPDF (PyMuPDF)."""
-    poppler_bin = resolve_poppler_bin()
-    info = pdfinfo_from_path(pdf_path, poppler_path=str(poppler_bin))
-    log(f"Processing your PDF which has {info['Pages']} pages → saving PNGs in {raw_dir}")
+        page = doc[page_idx]
+        zoom = min(dpi / 72.0, MAX_PX / max(page.rect.width, page.rect.height, 1))
+        # Black-and-white pages render to 8-bit grey: a third of the pixel bytes to encode and upload
+        cs = fitz.csGRAY if _is_monochrome(page) else fitz.csRGB
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=cs, alpha=False)
+        # JPEG encodes much faster than PNG for full-colour scans and keeps the uploads small
+        Path(out_path).write_bytes(pix.tobytes("jpeg", jpg_quality=JPEG_QUALITY))
+    return zoom * 72.0
+
+def page_count(pdf_path: str) -> int:
+    with fitz.open(pdf_path) as doc:
+        return doc.page_count
 
+async def extract_pages(pdf_path: str, dpi: int, raw_dir: Path, log, skip=()) -> AsyncIterator[Path]:
+    """
+    Render pages to JPEG with PyMuPDF on a process pool (one worker per core) and yield each
+    path, in page order, as soon as it is saved. Only `workers` pages are rendered ahead of
+    the consumer, so a slow consumer holds back rendering instead of filling the disk.
+    Page numbers in `skip` (1-based) are not rendered; their would-be path is yielded as is.
+    """
     raw_dir.mkdir(parents=True, exist_ok=True)
-    for p in raw_dir.glob("*"):
-        if p.is_file() and p.suffix.lower() in IMG_EXTS:
-            try: p.unlink(missing_ok=True)
-            except: pass
+    wipe_images_only(raw_dir)
+
+    total = page_count(pdf_path)
+    log(f"Processing your PDF which has {total} pages → saving JPEGs in {raw_dir}")
+    if not total:
+        raise RuntimeError("No images were produced by PyMuPDF rendering.")
 
-    out_paths: List[Path] = []
+    loop = asyncio.get_running_loop()
+    workers = min(total, os.cpu_count() or 1)
+    # Rasterizing is CPU-bound inside MuPDF; a single page just goes to the default thread pool
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
     try:
-        pages = convert_from_path(pdf_path, dpi=dpi, fmt="png", poppler_path=str(poppler_bin))
-        for i, pg in enumerate(pages, 1):
-            out = raw_dir / f"page-{i:03}.png"
-            pg.save(out)
-            out_paths.append(out)
-            log(f"  ✓ {out.name}")
-    except Exception as e:
-        log(f"⚠ Poppler render failed: {e}")
-
-    need_fallback = False
-    if out_paths:
-        sample = out_paths[:min(3, len(out_paths))]
-        if len(out_paths) > 3:
-            sample.append(out_paths[-1])
-        blanks = sum(1 for p in sample if is_mostly_blank(p))
-        if blanks >= max(2, len(sample) // 2):
-            need_fallback = True
-            log("⚠ Detected mostly blank pages from Poppler render; will fallback to MuPDF.")
-    else:
-        need_fallback = True
-        log("⚠ No pages produced by Poppler; will fallback to MuPDF.")
-
-    if need_fallback:
-        for p in out_paths:
-            try: p.unlink(missing_ok=True)
-            except: pass
-        out_paths = render_with_pymupdf(pdf_path, dpi, raw_dir, log)
-
-    return out_paths
+        pending = deque()
+        next_idx = 0
+        for _ in range(total):
+            while next_idx < total and len(pending) < workers:
+                dst = raw_dir / f"page-{next_idx + 1:03}.jpg"
+                if next_idx + 1 in skip:
+                    pending.append((dst, None))
+                else:
+                    pending.append((dst, loop.run_in_executor(pool, _render_page, pdf_path, next_idx, dpi, dst.as_posix())))
+                next_idx += 1
+            dst, fut = pending.popleft()
+            if fut is None:
+                yield dst
+                continue
+            used_dpi = await fut
+            if used_dpi < dpi:
+                log(f"⚠ {dst.name} is very large; rendered at {used_dpi:.0f} DPI to stay within {MAX_PX}px")
+            log(f"  ✓ {dst.name}")
+            yield dst
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+TRANSLATE_ORIGIN = "https://translate.google.co.in"
+
+class BrowserSession:
+    """
+    Playwright + CDP connection to the debugging Chrome. Kept open across runs (e.g. by the
+    GUI) so each translation skips Playwright start-up and the CDP handshake.
+    """
+    def __init__(self):
+        self.pw = None
+        self.browser = None
+        self.ctx = None
+
+    async def context(self, log):
+        """Return the browser context, (re)connecting first if needed."""
+        if self.browser is not None and self.browser.is_connected():
+            return self.ctx
+        await self.close(close_browser=False)
+        launch_chrome_if_needed(log)
+        self.pw = await async_playwright().start()
+        self.browser = await self.pw.chromium.connect_over_cdp(REMOTE)
+        self.ctx = self.browser.contexts[0] if self.browser.contexts else await self.browser.new_context(accept_downloads=True)
+
+        # Grant clipboard permissions so Copy text works reliably
+        try:
+            await self.ctx.grant_permissions(["clipboard-read", "clipboard-write"], origin=TRANSLATE_ORIGIN)
+        except Exception:
+            pass
+        return self.ctx
+
+    async def close(self, close_browser: bool):
+        browser, pw = self.browser, self.pw
+        self.pw = self.browser = self.ctx = None
+        if browser is not None:
+            if close_browser:
+                # Try a graceful browser-wide close via DevTools
+                try:
+                    # Ask the debugging browser to exit entirely
+                    cdp = await browser.new_browser_cdp_session()
+                    await cdp.send("Browser.close")
+                except Exception:
+                    pass
+
+            # Close Playwright connection (safe even if Browser.close already ended it)
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        if pw is not None:
+            try:
+                await pw.stop()
+            except Exception:
+                pass
 
 async def translate_images(
-    img_paths: List[Path],
+    pages: asyncio.Queue,
+    total: int,
     target_lang: str,
     close_browser: bool,
     trans_dir: Path,
     log=None,
     txt_append_path: Optional[Path] = None,   # NEW
+    tabs: int = TRANSLATE_TABS,
+    session: Optional[BrowserSession] = None,
+    cache_dir: Optional[Path] = None,
+    cached: Optional[dict] = None,
 ) -> List[Path]:
     """
     Upload images to Google Translate, download translated images,
     and (NEW) copy translated text to translated.txt.
+    Up to `tabs` pages are translated concurrently, one browser tab each.
+    Pass a `session` to reuse its browser connection across calls. Pages already stored in
+    `cache_dir` are taken from there without uploading; new translations are added to it.
+    `cached` is the cached_pages() listing of `cache_dir`, when the caller already has it.
     """
     trans_dir.mkdir(parents=True, exist_ok=True)
-    for p in trans_dir.glob("*"):
-        if p.is_file() and p.suffix.lower() in IMG_EXTS:
-            try: p.unlink(missing_ok=True)
-            except: pass
-
-    results: List[Path] = []
-    url = f"https://translate.google.co.in/?sl=auto&tl={target_lang}&op=images"
-    launch_chrome_if_needed(log or (lambda *_: None))
+    wipe_images_only(trans_dir)
 
-    async with async_playwright() as pw:
-        browser = await pw.chromium.connect_over_cdp(REMOTE)
-        try:
-            ctx = browser.contexts[0] if browser.contexts else await browser.new_context(accept_downloads=True)
+    results: dict = {}   # page number -> translated image
+    if cached is None:
+        cached = await asyncio.to_thread(cached_pages, cache_dir) if cache_dir else {}
+    if cached:
+        log(f"Reusing {len(cached)} cached page(s) from {cache_dir}")
+    url = f"{TRANSLATE_ORIGIN}/?sl=auto&tl={target_lang}&op=images"
+    own_session = session is None
+    if own_session:
+        session = BrowserSession()
+    ctx = await session.context(log or (lambda *_: None))
+    try:
+        # The clipboard is shared by every tab, so copy + read must not interleave
+        clipboard_lock = asyncio.Lock()
+        page_numbers = itertools.count(1)
+        texts: dict = {}      # page number -> (image name, copied text), written once at the end
 
-            # Grant clipboard permissions so Copy text works reliably
-            origin = "https://translate.google.co.in"
+        def write_texts(ready):
+            chunk = "".join(f"\n===== {name} =====\n{copied.strip()}\n" for name, copied in ready)
             try:
-                await ctx.grant_permissions(["clipboard-read", "clipboard-write"], origin=origin)
-            except Exception:
-                pass
+                with open(txt_append_path, "a", encoding="utf-8") as fp:
+                    fp.write(chunk)
+                log(f"Appended text for {len(ready)} page(s) to {txt_append_path.name}")
+            except Exception as e:
+                log(f"⚠ Could not append text to {txt_append_path.name}: {e}")
 
+        async def translate_tab():
             page = await ctx.new_page()
             await page.goto(url)
 
-            browse_btn   = page.get_by_role("button", name=re.compile(r"Browse your files", re.I))
-            download_btn = page.get_by_role("button", name=re.compile(r"(Download translation|Download)", re.I))
-            clear_btn    = page.get_by_role("button", name=re.compile(r"(Clear image|Clear)", re.I))
+            file_input   = page.locator('input[type="file"]')
+            browse_btn   = page.get_by_role("button", name=BROWSE_RE)
+            download_btn = page.get_by_role("button", name=DOWNLOAD_RE)
+            clear_btn    = page.get_by_role("button", name=CLEAR_RE)
             show_translated = page.get_by_text("Show translated", exact=True)
-            copy_btn_role  = page.get_by_role("button", name=re.compile(r"Copy text", re.I))
-            copy_btn_css   = page.locator('button[aria-label="Copy text"]')  # fallback
-
-            total = len(img_paths)
-            for idx, img in enumerate(img_paths, 1):
-                log(f"[{idx}/{total}] {img.name}")
-
-                payload = {
-                    "name": img.name,
-                    "mimeType": guess_type(img.name)[0] or "application/octet-stream",
-                    "buffer": img.read_bytes()
-                }
-                try:
-                    await page.locator('input[type="file"]').set_input_files(payload, timeout=1500)
-                except Exception:
-                    async with page.expect_file_chooser() as fc:
-                        await browse_btn.click()
-                    chooser = await fc.value
-                    await chooser.set_files(payload)
-
-                if await show_translated.count() > 0:
-                    await show_translated.first.click()
-
-                await download_btn.first.wait_for(state="visible", timeout=60000)
-                async with page.expect_download() as dl_info:
-                    await download_btn.first.click()
-                dl = await dl_info.value
-                suggested = dl.suggested_filename or f"{img.stem}-translated.png"
-                ext = Path(suggested).suffix or ".png"
-                out_img = trans_dir / f"{img.stem}-translated{ext}"
-                await dl.save_as(str(out_img))
-                results.append(out_img)
-                log(f"   ↳ saved {out_img.name}")
-
-                # --- NEW: Copy text and append to file
-                copied = ""
-                try:
-                    target_btn = copy_btn_role if await copy_btn_role.count() else copy_btn_css
-                    if await target_btn.count():
-                        await target_btn.first.click()
-                        await page.wait_for_timeout(150)
-                        copied = await page.evaluate("navigator.clipboard.readText()")
-                except Exception:
-                    copied = ""
+            toggled_to_translated = False
 
-                if copied and txt_append_path:
+            try:
+                # Pages arrive from the renderer as they are saved; None marks the end
+                while (img := await pages.get()) is not None:
+                    if isinstance(img, Exception):
+                        raise img
+                    idx = next(page_numbers)
+                    log(f"[{idx}/{total}] {img.name}")
+
+                    if idx in cached:
+                        cached_img, cached_txt = cached[idx]
+                        out_img = trans_dir / f"{img.stem}-translated{cached_img.suffix}"
+                        await asyncio.to_thread(link_or_copy, cached_img, out_img)
+                        results[idx] = out_img
+                        log(f"   ↳ {out_img.name} (cached)")
+                        try: img.unlink(missing_ok=True)
+                        except OSError: pass
+                        texts[idx] = (img.name, await asyncio.to_thread(cached_txt.read_text, encoding="utf-8"))
+                        continue
+
+                    # Hand Playwright the path; the browser reads the file itself
                     try:
-                        with open(txt_append_path, "a", encoding="utf-8") as fp:
-                            fp.write(f"\n===== {img.name} =====\n")
-                            fp.write(copied.strip())
-                            fp.write("\n")
-                        log(f"   ↳ appended text for {img.name} to {txt_append_path.name}")
-                    except Exception as e:
-                        log(f"⚠ Could not append text for {img.name}: {e}")
-
-                # Clear for next image
-                try: await clear_btn.click()
-                except: pass
-
-            await page.close()
-        finally:
-            if close_browser:
-                # Try a graceful browser-wide close via DevTools
-                try:
-                    # Ask the debugging browser to exit entirely
-                    cdp = await browser.new_browser_cdp_session()
-                    await cdp.send("Browser.close")
-                except Exception:
-                    pass
-
-                # Close Playwright connection (safe even if Browser.close already ended it)
-                try:
-                    await browser.close()
-                except Exception:
-                    pass
+                        await file_input.set_input_files(img, timeout=1500)
+                    except Exception:
+                        async with page.expect_file_chooser() as fc:
+                            await browse_btn.click()
+                        chooser = await fc.value
+                        await chooser.set_files(img)
+
+                    # The view mode sticks for the tab's session, so toggle it once and stop probing
+                    if not toggled_to_translated and await show_translated.count() > 0:
+                        await show_translated.first.click()
+                        toggled_to_translated = True
+
+                    # Wait only for attachment: click() already waits for the button to be visible and
+                    # enabled, so a separate visibility poll just repeats that work
+                    await download_btn.first.wait_for(state="attached", timeout=60000)
+                    async with page.expect_download(timeout=60000) as dl_info:
+                        await download_btn.first.click(timeout=60000)
+                    dl = await dl_info.value
+                    suggested = dl.suggested_filename or f"{img.stem}-translated.png"
+                    ext = Path(suggested).suffix or ".png"
+                    out_img = trans_dir / f"{img.stem}-translated{ext}"
+                    await save_download(dl, out_img)
+                    results[idx] = out_img
+                    log(f"   ↳ saved {out_img.name}")
+                    # The rendered page is no longer needed; drop it now so raw/ never holds the whole PDF
+                    try: img.unlink(missing_ok=True)
+                    except OSError: pass
+
+                    # --- NEW: Copy text and append to file
+                    copied = ""
+                    try:
+                        async with clipboard_lock:
+                            await page.bring_to_front()
+                            copied = await page.evaluate(COPY_TEXT_JS)
+                    except Exception:
+                        copied = ""
+                    texts[idx] = (img.name, copied)
+                    # A failed copy comes back empty; leave that page out so the next run uploads it again
+                    if cache_dir and copied.strip():
+                        try:
+                            await asyncio.to_thread(store_cached, cache_dir, idx, out_img, copied)
+                        except OSError as e:
+                            log(f"⚠ Could not cache {out_img.name}: {e}")
+
+                    # Reset the input in-page so the next set_input_files always fires a change, and
+                    # clear the canvas only if the button is actually shown (no 30s auto-wait).
+                    # If that fails, reload the tab rather than upload onto a half-cleared page.
+                    try:
+                        await file_input.evaluate("el => { el.value = ''; }")
+                        if await clear_btn.is_visible():
+                            await clear_btn.click(timeout=5000)
+                    except Exception:
+                        log(f"   ↳ resetting tab after {img.name}")
+                        await page.goto(url)
+                        toggled_to_translated = False
+
+                # Let the other tabs see the end marker too
+                pages.put_nowait(None)
+            finally:
+                await page.close()
 
-                # If we launched Chrome ourselves, kill the whole process tree as fallback
-              
-    return results
+        workers = [asyncio.create_task(translate_tab()) for _ in range(max(1, min(tabs, total)))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for w in workers:
+                w.cancel()
+            raise
+        finally:
+            # One append for the whole run, in page order; pages finished before a failure still land
+            ready = [texts[i] for i in sorted(texts) if texts[i][1]]
+            if ready and txt_append_path:
+                await asyncio.to_thread(write_texts, ready)
+    finally:
+        # A session owned by this call never outlives it; a shared one stays connected unless
+        # the user asked for Chrome to be closed
+        if own_session or close_browser:
+            await session.close(close_browser)
+
+    return [results[i] for i in sorted(results)]
+
+def _as_jpeg_bytes(p: Path) -> bytes:
+    """Re-encode an image img2pdf cannot embed to JPEG, in memory."""
+    buf = io.BytesIO()
+    with Image.open(p) as im:
+        im.convert("RGB").save(buf, "JPEG", quality=90)
+    return buf.getvalue()
+
+def _img2pdf_input(p: Path):
+    try:
+        img2pdf.convert(str(p))
+        return str(p)
+    except (img2pdf.ImageOpenError, img2pdf.AlphaChannelError):
+        return _as_jpeg_bytes(p)
 
 def build_pdf(images: List[Path], out_pdf: Path, log):
     log("Building Your Final PDF…")
-    normalized: List[Path] = []
-    for p in images:
-        if p.suffix.lower() in (".png", ".jpg", ".jpeg"):
-            normalized.append(p); continue
-        with Image.open(p) as im:
-            q = p.with_suffix(".png"); im.save(q); normalized.append(q)
+    # img2pdf embeds PNG/JPEG/TIFF/... natively; only files it rejects get re-encoded
+    # Stream straight into the file instead of building the whole PDF in memory first
     with open(out_pdf, "wb") as f:
-        f.write(img2pdf.convert([str(p) for p in normalized]))
+        try:
+            img2pdf.convert([str(p) for p in images], outputstream=f)
+        except (img2pdf.ImageOpenError, img2pdf.AlphaChannelError):
+            f.seek(0); f.truncate()
+            # Pages are checked and re-encoded independently; Pillow releases the GIL while it codes
+            with ThreadPoolExecutor(max_workers=min(len(images), os.cpu_count() or 1)) as ex:
+                inputs = list(ex.map(_img2pdf_input, images))
+            img2pdf.convert(inputs, outputstream=f)
     log(f"✓ Saved → {out_pdf}")
 
-async def translate_pdf(input_pdf: str, output_pdf: str, target_lang: str = "en", dpi: int = 150, close_browser: bool = True, log=print):
+async def translate_pdf(input_pdf: str, output_pdf: str, target_lang: str = "en", dpi: int = 150, close_browser: bool = True, log=print,
+                        session: Optional[BrowserSession] = None, use_cache: bool = True):
     if not Path(input_pdf).is_file():
         raise FileNotFoundError(f"File not found: {input_pdf}")
 
@@ -375,16 +566,40 @@ async def translate_pdf(input_pdf: str, output_pdf: str, target_lang: str = "en"
     # try: txt_append_path.unlink(missing_ok=True)
     # except: pass
 
-    pages = extract_pages(input_pdf, dpi, raw_dir, log)
-    translated = await translate_images(
-        pages, target_lang, close_browser, trans_dir, log,
-        txt_append_path=txt_append_path,   # NEW
-    )
+    # Re-running the same PDF with the same language and DPI reuses earlier translations
+    cache_dir = await asyncio.to_thread(translation_cache_dir, input_pdf, target_lang, dpi) if use_cache else None
+    cached = await asyncio.to_thread(cached_pages, cache_dir) if cache_dir else {}
+
+    # Render and translate as a pipeline: page N uploads while page N+1 is still rasterizing.
+    # The bounded queue applies backpressure so rendering never runs far ahead of translation.
+    pages: asyncio.Queue = asyncio.Queue(maxsize=4)
+
+    async def render():
+        try:
+            # Pages with a cached translation are never uploaded, so they are not rendered either
+            async for page in extract_pages(input_pdf, dpi, raw_dir, log, skip=cached.keys()):
+                await pages.put(page)
+        except Exception as e:
+            await pages.put(e)  # hand render errors to the consumer
+            return
+        await pages.put(None)
+
+    renderer = asyncio.create_task(render())
+    try:
+        translated = await translate_images(
+            pages, page_count(input_pdf), target_lang, close_browser, trans_dir, log,
+            txt_append_path=txt_append_path,   # NEW
+            session=session,
+            cache_dir=cache_dir,
+            cached=cached,
+        )
+    finally:
+        renderer.cancel()
     build_pdf(translated, Path(output_pdf), log)
 
-    wipe_images_only(raw_dir)
-    wipe_images_only(trans_dir)
-    log(f"Cleaned up temporary images in {run_dir}.")
+    # The run directory is private to this run; drop the whole tree off the critical path
+    Thread(target=shutil.rmtree, args=(run_dir,), kwargs={"ignore_errors": True}, daemon=True).start()
+    log(f"Cleaning up temporary images in {run_dir}.")
 
 # ------------ GUI ------------
 class App(tk.Tk):
@@ -399,6 +614,7 @@ class App(tk.Tk):
         self.lang    = tk.StringVar(value="en")
         self.dpi     = tk.IntVar(value=150)
         self.close_chrome = tk.BooleanVar(value=True)
+        self.use_cache = tk.BooleanVar(value=True)
 
         frm = ttk.Frame(self, padding=12); frm.pack(fill="both", expand=True)
 
@@ -419,27 +635,60 @@ class App(tk.Tk):
         ttk.Label(opt, text="DPI:").grid(row=0, column=2, sticky="w")
         ttk.Entry(opt, textvariable=self.dpi, width=6).grid(row=0, column=3, padx=6)
         ttk.Checkbutton(opt, text="Close Chrome on finish", variable=self.close_chrome).grid(row=0, column=4, padx=12)
+        ttk.Checkbutton(opt, text="Reuse cached pages", variable=self.use_cache).grid(row=0, column=5)
 
         # Buttons to start and quit
         btns = ttk.Frame(frm); btns.grid(row=3, column=0, columnspan=3, pady=6, sticky="ew")
         self.run_btn = ttk.Button(btns, text="Translate PDF", command=self.start)
         self.run_btn.pack(side="left")
         ttk.Button(btns, text="Quit", command=self.destroy).pack(side="right")
+        ttk.Button(btns, text="Clear cache", command=self.clear_cache).pack(side="right", padx=6)
+        self.progress = ttk.Progressbar(btns, mode="indeterminate")
+        self.progress.pack(side="left", fill="x", expand=True, padx=12)
 
         # Log display section
         self.log = tk.Text(frm, height=14); self.log.grid(row=4, column=0, columnspan=3, sticky="nsew", pady=(6,0))
         frm.columnconfigure(1, weight=1)
 
+        # Worker threads only queue log lines; the Tk thread flushes them in batches
+        self.log_q = queue.SimpleQueue()
+        self.after(50, self._drain_log)
+
+        # One long-lived event loop owns the browser connection, so it survives between runs
+        self.loop = asyncio.new_event_loop()
+        Thread(target=self.loop.run_forever, daemon=True).start()
+        self.session = BrowserSession()
+
     def pick_in(self):
         f = filedialog.askopenfilename(filetypes=[("PDF files","*.pdf")])
         if f: self.in_var.set(f)
 
+    def clear_cache(self):
+        if not messagebox.askyesno(APP_NAME, "Delete all cached translations?"):
+            return
+        def worker():
+            clear_translation_cache()
+            self.log_write(f"Cleared cached translations in {cache_root()}")
+        Thread(target=worker, daemon=True).start()
+
     def pick_out(self):
         f = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF files","*.pdf")])
         if f: self.out_var.set(f)
 
     def log_write(self, msg):
-        self.log.insert("end", msg + "\n"); self.log.see("end"); self.update_idletasks()
+        self.log_q.put(msg)
+
+    def _drain_log(self):
+        # At most 64 lines per tick, so a burst of log lines can't stall the event loop
+        batch = []
+        try:
+            while len(batch) < 64:
+                batch.append(self.log_q.get_nowait())
+        except queue.Empty:
+            pass
+        if batch:
+            self.log.insert("end", "\n".join(batch) + "\n"); self.log.see("end")
+        self.after(50, self._drain_log)
 
     def start(self):
         if not self.in_var.get():
@@ -447,22 +696,43 @@ class App(tk.Tk):
         if not self.out_var.get():
             messagebox.showwarning(APP_NAME, "Specify an output path."); return
         self.run_btn.configure(state="disabled")
+        self.progress.start(50)
         def worker():
+            error = None
             try:
-                asyncio.run(translate_pdf(
+                asyncio.run_coroutine_threadsafe(translate_pdf(
                     self.in_var.get(), self.out_var.get(),
                     target_lang=self.lang.get().strip() or "en",
                     dpi=int(self.dpi.get()),
                     close_browser=bool(self.close_chrome.get()),
-                    log=self.log_write
-                ))
+                    log=self.log_write,
+                    session=self.session,
+                    use_cache=bool(self.use_cache.get()),
+                ), self.loop).result()
                 self.log_write("✅ Yayy! We've Done It. Check your output PDF.")
             except Exception as e:
+                error = e
                 self.log_write(f"❌ Error: {e}")
-                messagebox.showerror(APP_NAME, str(e))
             finally:
-                self.run_btn.configure(state="normal")
+                # Widgets belong to the Tk thread; hand the wrap-up back to it
+                self.after(0, self._finish, error)
         Thread(target=worker, daemon=True).start()
 
+    def _finish(self, error):
+        self.progress.stop()
+        self.run_btn.configure(state="normal")
+        if error is not None:
+            messagebox.showerror(APP_NAME, str(error))
+
+    def destroy(self):
+        # Disconnect from Chrome (leaving it open) before the loop goes away
+        try:
+            asyncio.run_coroutine_threadsafe(self.session.close(close_browser=False), self.loop).result(timeout=5)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        super().destroy()
+
 if __name__ == "__main__":
+    freeze_support()  # worker processes in the PyInstaller build
     App().mainloop()
\ No newline at end of file
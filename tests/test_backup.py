@@ -0,0 +1,56 @@
+import unittest
+
+import fitz  # PyMuPDF
+
+try:
+    import backup
+except ImportError as e:  # playwright / python-docx not installed
+    backup = None
+    SKIP_REASON = f"backup.py dependencies missing: {e}"
+else:
+    SKIP_REASON = ""
+
+A4 = (595, 842)
+LETTER = (612, 792)
+A3 = (842, 1191)
+
+
+@unittest.skipIf(backup is None, SKIP_REASON)
+class PageZoomTest(unittest.TestCase):
+    def effective_dpi(self, size, dpi):
+        doc = fitz.open()
+        page = doc.new_page(width=size[0], height=size[1])
+        zoom, clamped = backup._page_zoom(page, dpi / 72.0)
+        return zoom * 72.0, max(size) * zoom, clamped
+
+    def test_never_below_requested_dpi(self):
+        for size in (A4, LETTER, A3):
+            for dpi in (100, 110, 130, 150, 170):
+                used, long_px, clamped = self.effective_dpi(size, dpi)
+                with self.subTest(size=size, dpi=dpi):
+                    if clamped:
+                        self.assertAlmostEqual(long_px, backup.MAX_PX, places=3)
+                    else:
+                        self.assertGreaterEqual(used, dpi - 1e-6)
+                        self.assertLessEqual(long_px, backup.MAX_PX + 1e-6)
+
+    def test_rounds_up_to_next_step(self):
+        # A4 at 130 DPI is ~1520px on the long side: it must become 1600px, not 1024px
+        used, long_px, clamped = self.effective_dpi(A4, 130)
+        self.assertFalse(clamped)
+        self.assertAlmostEqual(long_px, 1600, places=3)
+        self.assertAlmostEqual(used, 1600 / 842 * 72, places=3)
+
+    def test_large_pages_are_capped(self):
+        used, long_px, clamped = self.effective_dpi(A3, 300)
+        self.assertTrue(clamped)
+        self.assertAlmostEqual(long_px, backup.MAX_PX, places=3)
+
+    def test_small_renders_keep_their_zoom(self):
+        used, long_px, clamped = self.effective_dpi(A4, 72)
+        self.assertFalse(clamped)
+        self.assertAlmostEqual(used, 72, places=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import asyncio
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+try:
+    import new
+except ImportError as e:  # playwright not installed
+    new = None
+    SKIP_REASON = f"new.py dependencies missing: {e}"
+else:
+    SKIP_REASON = ""
+
+
+class FakeChrome:
+    """One Chrome instance. Like Playwright, every CDP connection re-points its download folder."""
+
+    def __init__(self):
+        self.connections = 0
+        self.download_owner = None
+        self.downloads = []
+        self.screenshots = []
+
+
+class FakeLocator:
+    def __init__(self, page):
+        self.page = page
+
+    first = last = property(lambda self: self)
+
+    def filter(self, **kwargs):
+        return self
+
+    def locator(self, *args, **kwargs):
+        return self
+
+    async def click(self, **kwargs): pass
+    async def set_input_files(self, *args, **kwargs): pass
+    async def wait_for(self, **kwargs): pass
+    async def count(self): return 0
+    async def is_visible(self): return True
+    async def scroll_into_view_if_needed(self): pass
+
+    async def screenshot(self, path, **kwargs):
+        self.page.chrome.screenshots.append(path)
+
+
+class FakeDownload:
+    suggested_filename = "translated.png"
+
+    def __init__(self, page):
+        self.page = page
+
+    async def save_as(self, path):
+        chrome = self.page.chrome
+        if chrome.download_owner is not self.page.connection:
+            raise RuntimeError("download is not in this connection's folder")
+        chrome.downloads.append(path)
+
+
+class FakeExpectDownload:
+    def __init__(self, page):
+        loop = asyncio.get_running_loop()
+        self.value = loop.create_future()
+        self.value.set_result(FakeDownload(page))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakePage:
+    def __init__(self, connection):
+        self.connection = connection
+        self.chrome = connection.chrome
+
+    async def goto(self, *args, **kwargs): pass
+    async def wait_for_timeout(self, ms): pass
+    async def close(self): pass
+
+    def get_by_role(self, *args, **kwargs):
+        return FakeLocator(self)
+
+    get_by_text = locator = get_by_role
+
+    def expect_download(self, **kwargs):
+        return FakeExpectDownload(self)
+
+
+class FakeConnection:
+    def __init__(self, chrome):
+        self.chrome = chrome
+        self.contexts = [self]
+
+    async def new_page(self):
+        return FakePage(self)
+
+
+class FakePlaywright:
+    def __init__(self, chrome):
+        self.chromium = self
+        self.chrome = chrome
+
+    async def connect_over_cdp(self, url):
+        connection = FakeConnection(self.chrome)
+        self.chrome.connections += 1
+        self.chrome.download_owner = connection
+        return connection
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@unittest.skipIf(new is None, SKIP_REASON)
+class TranslateAllTest(unittest.TestCase):
+    def test_every_tab_takes_the_download_path(self):
+        chrome = FakeChrome()
+        files = [Path(f"img-{i}.png") for i in range(10)]
+        with tempfile.TemporaryDirectory() as out_dir, \
+                mock.patch.object(new, "OUT_DIR", Path(out_dir)), \
+                mock.patch.object(new, "async_playwright", lambda: FakePlaywright(chrome)), \
+                contextlib.redirect_stdout(io.StringIO()):
+            ok = asyncio.run(new.translate_all(files))
+
+        self.assertEqual(ok, len(files))
+        self.assertEqual(chrome.connections, 1)
+        self.assertEqual(len(chrome.downloads), len(files))
+        self.assertEqual(chrome.screenshots, [])
+
+
+if __name__ == "__main__":
+    unittest.main()